@@ -15,12 +15,28 @@ class PasswordController(QObject):
     password_generated = pyqtSignal(str)
     password_strength_updated = pyqtSignal(dict)
     
+    # Characters dropped by the exclude_similar / exclude_ambiguous options
+    SIMILAR_CHARS = "l1IO0"
+    AMBIGUOUS_CHARS = "{}[]()/\\|`~"
+    
+    # Strength (label, color) shown by the views, indexed by score clamped to 0..4
+    STRENGTH_LEVELS = (("Weak", "#d13438"),) * 3 + (("Fair", "#ff8c00"), ("Good", "#ffb900"))
+    
+    _shared_instance = None
+    
     def __init__(self):
         """Initialize the password controller."""
         super().__init__()
         self.validator = InputValidator()
         self.logger = logging.getLogger(__name__)
     
+    @classmethod
+    def shared(cls) -> "PasswordController":
+        """Get the instance shared by the views, creating it on first use."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+    
     def generate_password(self, length: int, use_uppercase: bool = True, 
                          use_lowercase: bool = True, use_digits: bool = True, 
                          use_special_chars: bool = True, exclude_similar: bool = False,
@@ -32,60 +48,38 @@ class PasswordController(QObject):
                 length, use_uppercase, use_lowercase, use_digits, use_special_chars
             )
             if not valid:
-                self.logger.error(f"Password generation validation failed: {msg}")
+                self.logger.error("Password generation validation failed: %s", msg)
                 return ""
             
-            # If exclusions are requested, we need to generate a longer password
-            # to account for characters that will be removed
-            adjusted_length = length
-            if exclude_similar or exclude_ambiguous:
-                # Increase length to compensate for excluded characters
-                adjusted_length = int(length * 1.5)
-            
-            # Generate password using the utility class
-            password = PasswordGenerator.generate_password(
-                adjusted_length, use_uppercase, use_lowercase, use_digits, use_special_chars
+            # Exclusions are removed from the character sets up front, so the
+            # password comes out at the requested length with every category present
+            excluded_chars = ""
+            if exclude_similar:
+                excluded_chars += self.SIMILAR_CHARS
+            if exclude_ambiguous:
+                excluded_chars += self.AMBIGUOUS_CHARS
+            pools = PasswordGenerator.character_pools(
+                use_uppercase, use_lowercase, use_digits, use_special_chars, excluded_chars
             )
+            password = PasswordGenerator.generate_from_pools(length, pools)
             
             if password:
-                # Apply additional filters if requested
-                if exclude_similar:
-                    password = self._exclude_similar_characters(password)
-                if exclude_ambiguous:
-                    password = self._exclude_ambiguous_characters(password)
-                
-                # Ensure the final password meets the minimum length requirement
-                # If it's too short, generate a new one
-                if len(password) < length:
-                    # Try generating again with a longer length
-                    retry_length = int(length * 2)
-                    retry_password = PasswordGenerator.generate_password(
-                        retry_length, use_uppercase, use_lowercase, use_digits, use_special_chars
-                    )
-                    if retry_password:
-                        if exclude_similar:
-                            retry_password = self._exclude_similar_characters(retry_password)
-                        if exclude_ambiguous:
-                            retry_password = self._exclude_ambiguous_characters(retry_password)
-                        
-                        # Take the first 'length' characters
-                        password = retry_password[:length]
-                
-                # Ensure we don't exceed the requested length
-                if len(password) > length:
-                    password = password[:length]
-                
                 self.password_generated.emit(password)
-                self.logger.info(f"Generated password of length {len(password)}")
+                self.logger.info("Generated password of length %d", len(password))
                 return password
             else:
                 self.logger.error("Failed to generate password")
                 return ""
                 
         except Exception as e:
-            self.logger.error(f"Error generating password: {e}")
+            self.logger.error("Error generating password: %s", e)
             return ""
     
+    @classmethod
+    def strength_level(cls, score: int) -> tuple[str, str]:
+        """Get the (label, color) pair to display for a strength score."""
+        return cls.STRENGTH_LEVELS[min(max(score, 0), len(cls.STRENGTH_LEVELS) - 1)]
+    
     def check_password_strength(self, password: str) -> dict:
         """Check password strength and return detailed feedback."""
         try:
@@ -93,20 +87,9 @@ class PasswordController(QObject):
             self.password_strength_updated.emit(strength_info)
             return strength_info
         except Exception as e:
-            self.logger.error(f"Error checking password strength: {e}")
+            self.logger.error("Error checking password strength: %s", e)
             return {
                 'is_strong': False,
                 'score': 0,
                 'feedback': ['Error checking password strength']
             }
-    
-    def _exclude_similar_characters(self, password: str) -> str:
-        """Exclude similar characters from password."""
-        similar_chars = "l1IO0"
-        return ''.join(c for c in password if c not in similar_chars)
-    
-    def _exclude_ambiguous_characters(self, password: str) -> str:
-        """Exclude ambiguous characters from password."""
-        ambiguous_chars = "{}[]()/\\|`~"
-        return ''.join(c for c in password if c not in ambiguous_chars)
-    
\ No newline at end of file
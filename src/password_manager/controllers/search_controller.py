@@ -4,33 +4,137 @@ Handles search and filtering operations for password entries.
 """
 
 import logging
-from typing import List, Dict
+from collections import defaultdict
+from typing import List, Dict, Optional, Set
 from PyQt6.QtCore import QObject, pyqtSignal
 
+_SEARCH_FIELDS = ("Name", "Address", "Username", "Notes")
+
+# Vault size from which substring searches are narrowed with a trigram index;
+# below it a plain scan is cheaper than building and intersecting postings
+_TRIGRAM_INDEX_MIN_ENTRIES = 500
+
+def _field_matcher(field: str):
+    """Build a predicate testing whether a lowercased needle occurs in one entry field."""
+    def matches(entry: Dict, search_text: str) -> bool:
+        return search_text in str(entry.get(field, '')).lower()
+    return matches
+
+def _match_all(entry: Dict, search_text: str) -> bool:
+    """Check whether a lowercased needle occurs in any searchable entry field."""
+    return any(search_text in str(entry.get(field, '')).lower() for field in _SEARCH_FIELDS)
+
+# Per-field predicates, dispatched on the filter combo's text
+_FIELD_MATCHERS = {field: _field_matcher(field) for field in _SEARCH_FIELDS}
+_FIELD_MATCHERS["All"] = _match_all
+
+class SearchIndex:
+    """Lowercased searchable text of a list of entries, stored column by column."""
+    
+    def __init__(self, columns: Dict[str, List[str]], trigrams: Optional[Dict[str, Set[int]]] = None):
+        """Initialize the search index.
+        
+        Args:
+            columns: Lowercased text per filter field, aligned with the entries
+            trigrams: Optional map of three-character substrings of the "All"
+                column to the rows containing them
+        """
+        self.columns = columns
+        self.trigrams = trigrams
+    
+    def candidate_rows(self, search_text: str) -> Optional[List[int]]:
+        """Get the rows that may contain the search text, or None to scan every row."""
+        if self.trigrams is None or len(search_text) < 3:
+            return None
+        
+        postings = []
+        for start in range(len(search_text) - 2):
+            rows = self.trigrams.get(search_text[start:start + 3])
+            if not rows:
+                return []
+            postings.append(rows)
+        # Intersect starting from the rarest trigram
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
+
+def _build_trigram_index(texts: List[str]) -> Dict[str, Set[int]]:
+    """Map each three-character substring to the rows whose text contains it."""
+    trigrams: Dict[str, Set[int]] = defaultdict(set)
+    for row, text in enumerate(texts):
+        for start in range(len(text) - 2):
+            trigrams[text[start:start + 3]].add(row)
+    return dict(trigrams)
+
 class SearchController(QObject):
     """Search controller for entry filtering and search operations."""
     
     search_results_updated = pyqtSignal(list)
     
+    SEARCH_FIELDS = _SEARCH_FIELDS
+    
     def __init__(self):
         """Initialize the search controller."""
         super().__init__()
         self.logger = logging.getLogger(__name__)
     
-    def filter_entries(self, entries: List[Dict], search_text: str, filter_field: str) -> List[Dict]:
-        """Filter entries based on search text and field filter."""
+    def build_search_index(self, entries: List[Dict]) -> SearchIndex:
+        """Precompute the lowercased searchable text of each entry, column by column."""
+        columns = {
+            field: [str(entry.get(field, '')).lower() for entry in entries]
+            for field in self.SEARCH_FIELDS
+        }
+        # Newline-joined so an "All" match cannot straddle two fields
+        columns["All"] = [
+            "\n".join(fields)
+            for fields in zip(*(columns[field] for field in self.SEARCH_FIELDS))
+        ]
+        
+        # Every field's text is part of "All", so its trigrams narrow any field filter
+        trigrams = None
+        if len(entries) >= _TRIGRAM_INDEX_MIN_ENTRIES:
+            trigrams = _build_trigram_index(columns["All"])
+        return SearchIndex(columns, trigrams)
+    
+    def filter_entries(self, entries: List[Dict], search_text: str, filter_field: str,
+                       search_index: Optional[SearchIndex] = None) -> List[Dict]:
+        """Filter entries based on search text and field filter.
+        
+        Args:
+            entries: Entries to filter
+            search_text: Text to search for (case-insensitive)
+            filter_field: Field to search in, or "All"
+            search_index: Optional result of build_search_index for the same entries
+        """
         try:
             if not search_text.strip() and filter_field == "All":
                 # No search criteria, return all entries
                 self.search_results_updated.emit(entries)
                 return entries
             
-            filtered_entries = []
             search_lower = search_text.lower().strip()
             
-            for entry in entries:
-                if self._entry_matches_search(entry, search_lower, filter_field):
-                    filtered_entries.append(entry)
+            haystacks = search_index.columns.get(filter_field) if search_index is not None else None
+            if haystacks is not None:
+                candidates = search_index.candidate_rows(search_lower)
+                if candidates is None:
+                    # Single substring test per entry against the pre-lowered column
+                    filtered_entries = [
+                        entry for entry, text in zip(entries, haystacks)
+                        if search_lower in text
+                    ]
+                else:
+                    # Only rows holding every trigram of the search text can match
+                    filtered_entries = [
+                        entries[row] for row in candidates if search_lower in haystacks[row]
+                    ]
+            elif search_lower:
+                # Resolve the field predicate once rather than branching per entry
+                matcher = _FIELD_MATCHERS.get(filter_field)
+                filtered_entries = [
+                    entry for entry in entries if matcher(entry, search_lower)
+                ] if matcher is not None else []
+            else:
+                filtered_entries = list(entries)
             
             self.search_results_updated.emit(filtered_entries)
             self.logger.debug(f"Filtered {len(entries)} entries to {len(filtered_entries)} results")
@@ -40,32 +144,6 @@ class SearchController(QObject):
             self.logger.error(f"Error filtering entries: {e}")
             return entries
     
-    def _entry_matches_search(self, entry: Dict, search_text: str, filter_field: str) -> bool:
-        """Check if an entry matches the search criteria."""
-        if not search_text:
-            return True
-        
-        if filter_field == "All":
-            # Search across all relevant fields
-            searchable_fields = [
-                str(entry.get('Name', '')),
-                str(entry.get('Address', '')),
-                str(entry.get('Username', '')),
-                str(entry.get('Notes', ''))
-            ]
-            return any(search_text in field.lower() for field in searchable_fields)
-        
-        elif filter_field == "Name":
-            return search_text in str(entry.get('Name', '')).lower()
-        elif filter_field == "Username":
-            return search_text in str(entry.get('Username', '')).lower()
-        elif filter_field == "Address":
-            return search_text in str(entry.get('Address', '')).lower()
-        elif filter_field == "Notes":
-            return search_text in str(entry.get('Notes', '')).lower()
-        
-        return False
-    
     def clear_search(self, entries: List[Dict]) -> List[Dict]:
         """Clear search and return all entries."""
         self.search_results_updated.emit(entries)
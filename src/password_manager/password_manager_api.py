@@ -226,25 +226,25 @@ class PasswordManagerAPI:
         if not success:
             return False, f"Failed to retrieve entries for re-encryption: {entries_or_error}"
 
+        # Re-encrypt everything first, then write the entries and the new key details
+        # in one transaction, so a failure at any point leaves the stored data untouched
+        updates = []
         if isinstance(entries_or_error, list):
             for entry_dict in entries_or_error:
                 entry_id = entry_dict['id']
-                entry_name = entry_dict['EntryName']
                 original_content = {k: v for k, v in entry_dict.items() if k not in ['id', 'EntryName']}
                 original_json = json.dumps(original_content)
                 try:
-                    re_encrypted_data = self.encryption_handler.encrypt_data(new_derived_key, original_json)
-                    self.db_manager.update_entry(entry_id, self.current_user_id, entry_name, re_encrypted_data)
+                    updates.append((entry_id, self.encryption_handler.encrypt_data(new_derived_key, original_json)))
                 except Exception as e:
                     logging.error(f"Error re-encrypting entry ID {entry_id} during master password change: {e}")
                     return False, f"Error re-encrypting entry ID {entry_id}. Aborted."
 
-        updated_user = self.db_manager.update_user_master_key_details(self.current_user_id, new_salt, new_derived_key)
-        if updated_user:
+        if self.db_manager.update_master_key_and_entries(self.current_user_id, new_salt, new_derived_key, updates):
             self.current_master_key = new_derived_key
             return True, "Master password changed successfully. All entries have been re-encrypted."
         else:
-            return False, "Failed to update master password in database."
+            return False, "Failed to update master password in database. No changes were made."
 
     def generate_random_password(self, length: int, use_uppercase: bool, use_lowercase: bool, use_digits: bool, use_special_chars: bool) -> Tuple[bool, str]:
         """Generates a random password."""
@@ -9,6 +9,19 @@ class DatabaseManager:
     and performing CRUD operations for users and password entries.
     """
 
+    # Schema objects created by _create_tables
+    SCHEMA_OBJECTS = ("users", "entries", "idx_entries_user_id")
+
+    # Applied to file-backed databases only. WAL appends commits to a log instead of
+    # rewriting the main file, and with WAL, NORMAL sync skips the fsync per commit
+    # without risking corruption.
+    FILE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8000",
+    )
+
     def __init__(self, db_file: str = 'password_manager.db'):
         """
         Initializes the DatabaseManager.
@@ -19,7 +32,8 @@ class DatabaseManager:
         self.conn = None
         self.cursor = None
         self._connect()
-        self._create_tables()
+        if not self._schema_exists():
+            self._create_tables()
 
     def _connect(self):
         """
@@ -28,15 +42,28 @@ class DatabaseManager:
         try:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self.conn = sqlite3.connect(self.db_path)
+            # Rows still unpack and index like tuples, and can also be read by column name
+            self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
+            if str(self.db_path) != ':memory:':
+                for pragma in self.FILE_PRAGMAS:
+                    self.cursor.execute(pragma)
             logging.info(f"Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {e}")
             raise
 
+    def _schema_exists(self) -> bool:
+        """
+        Checks whether this database already has every table and index, so the DDL can be skipped.
+        """
+        placeholders = ", ".join("?" * len(self.SCHEMA_OBJECTS))
+        self.cursor.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", self.SCHEMA_OBJECTS)
+        return self.cursor.fetchone()[0] == len(self.SCHEMA_OBJECTS)
+
     def _create_tables(self):
         """
-        Creates the 'users' and 'entries' tables if they do not already exist.
+        Creates the 'users' and 'entries' tables and their indexes if they do not already exist.
         """
         try:
             self.cursor.execute('''
@@ -56,6 +83,8 @@ class DatabaseManager:
                     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
                 )
             ''')
+            # Every entry query filters by user; users.username is already indexed by its UNIQUE constraint
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_entries_user_id ON entries(user_id)")
             self.conn.commit()
             logging.info("Tables checked/created successfully.")
         except sqlite3.Error as e:
@@ -89,7 +118,7 @@ class DatabaseManager:
             logging.error(f"Error adding user '{username}': {e}")
             return None
 
-    def get_user_by_username(self, username: str) -> tuple | None:
+    def get_user_by_username(self, username: str) -> sqlite3.Row | None:
         """Retrieves user information by username."""
         try:
             self.cursor.execute("SELECT id, username, master_key_salt, master_key_hash FROM users WHERE username = ?", (username,))
@@ -130,7 +159,7 @@ class DatabaseManager:
             logging.error(f"Error adding entry for user ID {user_id}: {e}")
             return None
 
-    def get_entries_by_user_id(self, user_id: int) -> list[tuple]:
+    def get_entries_by_user_id(self, user_id: int) -> list[sqlite3.Row]:
         """Retrieves all encrypted password entries for a given user."""
         try:
             self.cursor.execute("SELECT id, user_id, entry_name, encrypted_entry_data FROM entries WHERE user_id = ?", (user_id,))
@@ -139,7 +168,7 @@ class DatabaseManager:
             logging.error(f"Error retrieving entries for user ID {user_id}: {e}")
             return []
 
-    def get_entry_by_id(self, entry_id: int, user_id: int) -> tuple | None:
+    def get_entry_by_id(self, entry_id: int, user_id: int) -> sqlite3.Row | None:
         """Retrieves a single encrypted password entry by its ID, scoped to a user."""
         try:
             self.cursor.execute("SELECT id, user_id, entry_name, encrypted_entry_data FROM entries WHERE id = ? AND user_id = ?", (entry_id, user_id))
@@ -166,6 +195,43 @@ class DatabaseManager:
             logging.error(f"Error updating entry ID {entry_id}: {e}")
             return False
 
+    def update_master_key_and_entries(self, user_id: int, new_salt: bytes, new_hash: bytes,
+                                      updates: list[tuple[int, bytes]]) -> bool:
+        """
+        Replaces the encrypted data of several entries and the user's master key details in a single transaction.
+        Args:
+            user_id (int): The ID of the user owning the entries.
+            new_salt (bytes): The new master key salt.
+            new_hash (bytes): The new master key hash.
+            updates (list[tuple[int, bytes]]): (entry_id, new_encrypted_data) pairs.
+        Returns:
+            bool: True if every entry and the user were updated. Otherwise no change is kept and False is returned.
+        """
+        try:
+            self.cursor.executemany(
+                "UPDATE entries SET encrypted_entry_data = ? WHERE id = ? AND user_id = ?",
+                [(new_encrypted_data, entry_id, user_id) for entry_id, new_encrypted_data in updates]
+            )
+            if updates and self.cursor.rowcount != len(updates):
+                self.conn.rollback()
+                logging.warning(f"Master key change for user ID {user_id} matched {self.cursor.rowcount} of {len(updates)} entries; rolled back.")
+                return False
+            self.cursor.execute(
+                "UPDATE users SET master_key_salt = ?, master_key_hash = ? WHERE id = ?",
+                (new_salt, new_hash, user_id)
+            )
+            if self.cursor.rowcount != 1:
+                self.conn.rollback()
+                logging.warning(f"Master key change for non-existent user ID {user_id}; rolled back.")
+                return False
+            self.conn.commit()
+            logging.info(f"Master key details and {len(updates)} entries updated for user ID {user_id}.")
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logging.error(f"Error changing master key for user ID {user_id}: {e}")
+            return False
+
     def delete_entry(self, entry_id: int, user_id: int) -> bool:
         """Deletes a password entry from the 'entries' table."""
         try:
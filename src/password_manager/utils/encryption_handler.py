@@ -1,21 +1,29 @@
 import os
 from base64 import urlsafe_b64encode
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
 
 class EncryptionHandler:
     """
     Handles key derivation using Argon2id from the cryptography library and
-    symmetric encryption/decryption of data using Fernet (built on AES).
+    symmetric encryption/decryption of data using AES-256-GCM.
+    Data encrypted with Fernet by earlier versions can still be decrypted.
     """
 
     # Argon2id parameters
     TIME_COST = 3
     MEMORY_COST_MiB = 64
     PARALLELISM_DEGREE = 2
-    KEY_LENGTH = 32  # For Fernet key
+    KEY_LENGTH = 32  # For AES-256 (and legacy Fernet) keys
     SALT_LEN = 16
 
+    # AES-GCM data layout: version byte, nonce, then ciphertext with the 16-byte tag.
+    # Fernet tokens are base64 text, so they never start with this byte.
+    AESGCM_VERSION = b"\x01"
+    NONCE_LEN = 12
+
     def __init__(self):
         """
         Initializes the EncryptionHandler.
@@ -42,7 +50,7 @@ class EncryptionHandler:
             salt (bytes): The salt bytes.
 
         Returns:
-            bytes: The derived key (32 bytes for Fernet).
+            bytes: The derived key (32 bytes).
         """
         kdf = Argon2id(
             salt=salt,
@@ -59,7 +67,7 @@ class EncryptionHandler:
         """
         Encrypts a string of data using a derived key.
 
-        The key must be 32 bytes long and url-safe base64 encoded for Fernet.
+        The data is encrypted with AES-256-GCM under a fresh random nonce.
         The data string will be encoded to UTF-8 bytes before encryption.
 
         Args:
@@ -67,24 +75,22 @@ class EncryptionHandler:
             data (str): The string data to be encrypted.
 
         Returns:
-            bytes: The encrypted data.
+            bytes: The format version byte, the nonce and the ciphertext with its tag.
         """
-        try:
-            # Fernet key needs to be URL-safe base64 encoded
-            fernet_key = urlsafe_b64encode(key)
-            f = Fernet(fernet_key)
-            encrypted_data = f.encrypt(data.encode('utf-8'))
-            return encrypted_data
-        except Exception:
-            # Re-raise the exception, allow the calling layer to handle logging/message
-            raise
+        if len(key) != EncryptionHandler.KEY_LENGTH:
+            raise ValueError(f"Key must be {EncryptionHandler.KEY_LENGTH} bytes long.")
+        nonce = os.urandom(EncryptionHandler.NONCE_LEN)
+        # The version byte is authenticated too, so it cannot be swapped without detection
+        ciphertext = AESGCM(key).encrypt(nonce, data.encode('utf-8'), EncryptionHandler.AESGCM_VERSION)
+        return EncryptionHandler.AESGCM_VERSION + nonce + ciphertext
 
     @staticmethod
     def decrypt_data(key: bytes, encrypted_data: bytes) -> str | None:
         """
         Decrypts bytes of data using a derived key.
 
-        The key must be 32 bytes long and url-safe base64 encoded for Fernet.
+        Data written by encrypt_data is decrypted with AES-256-GCM; anything without
+        its version byte is treated as a legacy Fernet token.
         The decrypted bytes will be decoded to a UTF-8 string.
 
         Args:
@@ -95,11 +101,17 @@ class EncryptionHandler:
             str | None: The decrypted string data, or None if decryption fails.
         """
         try:
+            version = encrypted_data[:1]
+            if version == EncryptionHandler.AESGCM_VERSION:
+                nonce_end = 1 + EncryptionHandler.NONCE_LEN
+                nonce = encrypted_data[1:nonce_end]
+                return AESGCM(key).decrypt(nonce, encrypted_data[nonce_end:], version).decode('utf-8')
+
             # Fernet key needs to be URL-safe base64 encoded
             fernet_key = urlsafe_b64encode(key)
             f = Fernet(fernet_key)
             decrypted_data = f.decrypt(encrypted_data).decode('utf-8')
             return decrypted_data
-        except (InvalidToken, Exception):
+        except (InvalidTag, InvalidToken, Exception):
             # Return None to be handled by the API layer
             return None
@@ -1,5 +1,28 @@
+import os
 import secrets
 import string
+from functools import lru_cache
+
+def _random_choices(pool: str, count: int) -> list[str]:
+    """
+    Picks count characters uniformly at random from pool.
+    Random bytes are read from the OS in bulk rather than once per character.
+    """
+    if len(pool) > 256:
+        return [secrets.choice(pool) for _ in range(count)]
+
+    # Bytes at or above the limit would bias the modulo, so they are rejected
+    limit = 256 - (256 % len(pool))
+    chars: list[str] = []
+    while len(chars) < count:
+        needed = count - len(chars)
+        # Over-read so that one batch almost always covers the rejected bytes
+        for byte in os.urandom(needed + needed // 2 + 8):
+            if byte < limit:
+                chars.append(pool[byte % len(pool)])
+                if len(chars) == count:
+                    break
+    return chars
 
 class PasswordGenerator:
     """
@@ -38,40 +61,72 @@ class PasswordGenerator:
         if length <= 0:
             return None
 
-        # Build the character pool based on selected options
-        character_pool = ""
-        if use_uppercase:
-            character_pool += PasswordGenerator.UPPERCASE_CHARS
-        if use_lowercase:
-            character_pool += PasswordGenerator.LOWERCASE_CHARS
-        if use_digits:
-            character_pool += PasswordGenerator.DIGIT_CHARS
-        if use_special_chars:
-            character_pool += PasswordGenerator.SPECIAL_CHARS
-
-        if not character_pool:
+        pools = PasswordGenerator.character_pools(
+            use_uppercase, use_lowercase, use_digits, use_special_chars
+        )
+        return PasswordGenerator.generate_from_pools(length, pools)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def character_pools(
+        use_uppercase: bool = True,
+        use_lowercase: bool = True,
+        use_digits: bool = True,
+        use_special_chars: bool = True,
+        excluded_chars: str = ""
+    ) -> tuple[str, ...]:
+        """
+        Gets the character sets selected by the given options.
+        Results are cached, as there are only a handful of option combinations.
+
+        Args:
+            use_uppercase (bool): Include uppercase letters.
+            use_lowercase (bool): Include lowercase letters.
+            use_digits (bool): Include digits.
+            use_special_chars (bool): Include special characters.
+            excluded_chars (str): Characters to remove from every set.
+
+        Returns:
+            tuple[str, ...]: The non-empty selected character sets, in a fixed order.
+        """
+        selected = (
+            (use_uppercase, PasswordGenerator.UPPERCASE_CHARS),
+            (use_lowercase, PasswordGenerator.LOWERCASE_CHARS),
+            (use_digits, PasswordGenerator.DIGIT_CHARS),
+            (use_special_chars, PasswordGenerator.SPECIAL_CHARS),
+        )
+        pools = (
+            "".join(c for c in chars if c not in excluded_chars)
+            for use, chars in selected if use
+        )
+        return tuple(pool for pool in pools if pool)
+
+    @staticmethod
+    def generate_from_pools(length: int, pools: tuple[str, ...]) -> str | None:
+        """
+        Generates a random password containing at least one character from each pool.
+
+        Args:
+            length (int): The desired length of the password.
+            pools (tuple[str, ...]): The character sets to draw from.
+
+        Returns:
+            str | None: The generated password string, or None if no pools
+                        are given or length is invalid.
+        """
+        if length <= 0 or not pools:
             return None
 
-        # Ensure the password contains at least one character from each selected category
-        password_chars = []
-        if use_uppercase:
-            password_chars.append(secrets.choice(PasswordGenerator.UPPERCASE_CHARS))
-        if use_lowercase:
-            password_chars.append(secrets.choice(PasswordGenerator.LOWERCASE_CHARS))
-        if use_digits:
-            password_chars.append(secrets.choice(PasswordGenerator.DIGIT_CHARS))
-        if use_special_chars:
-            password_chars.append(secrets.choice(PasswordGenerator.SPECIAL_CHARS))
-
-        # Fill the remaining length with random characters from the full pool
-        # Adjust length if initial guaranteed characters exceed it
-        remaining_length = length - len(password_chars)
-        if remaining_length < 0: # This can happen if length is too small for selected char types
-            # If length is too small, just return the required characters
-            return "".join(secrets.choice(character_pool) for _ in range(length))
-
-
-        password_chars.extend(secrets.choice(character_pool) for _ in range(remaining_length))
+        character_pool = "".join(pools)
+
+        # If length is too small for one character per pool, draw everything from the full pool
+        if length < len(pools):
+            return "".join(_random_choices(character_pool, length))
+
+        # Ensure the password contains at least one character from each selected category,
+        # then fill the remaining length from the full pool
+        password_chars = [secrets.choice(pool) for pool in pools]
+        password_chars.extend(_random_choices(character_pool, length - len(pools)))
 
         # Shuffle the characters to ensure randomness in position
         secrets.SystemRandom().shuffle(password_chars)
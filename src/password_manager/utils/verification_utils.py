@@ -12,6 +12,15 @@ class VerificationUtils:
     MAX_ENTRY_NAME_LENGTH = 100
     MAX_ENTRY_FIELD_LENGTH = 250
 
+    # Patterns compiled once at import rather than looked up on every call
+    _STRENGTH_CHECKS = (
+        ("uppercase letters", re.compile(r'[A-Z]')),
+        ("lowercase letters", re.compile(r'[a-z]')),
+        ("numbers", re.compile(r'\d')),
+        ("special characters", re.compile(r'[!@#$%^&*()_+={}\[\]:;\"\'<,>.?/~`\-]')),
+    )
+    _USERNAME_PATTERN = re.compile(r'[a-zA-Z0-9._-]+')
+
     @staticmethod
     def check_password_strength(password: str) -> dict:
         """
@@ -30,15 +39,8 @@ class VerificationUtils:
             feedback.append(f"Weak password: must be at least {VerificationUtils.MIN_PASSWORD_LENGTH} characters long.")
             is_strong = False
 
-        checks = {
-            "uppercase letters": r'[A-Z]',
-            "lowercase letters": r'[a-z]',
-            "numbers": r'\d',
-            "special characters": r'[!@#$%^&*()_+={}\[\]:;\"\'<,>.?/~`\-]'
-        }
-
-        for check_name, pattern in checks.items():
-            if not re.search(pattern, password):
+        for check_name, pattern in VerificationUtils._STRENGTH_CHECKS:
+            if not pattern.search(password):
                 feedback.append(f"Weak password: should include {check_name}.")
                 is_strong = False
 
@@ -71,7 +73,7 @@ class VerificationUtils:
         valid, msg = VerificationUtils.validate_length(username, VerificationUtils.MAX_USERNAME_LENGTH, "Username")
         if not valid:
             return valid, msg
-        if not re.fullmatch(r'^[a-zA-Z0-9._-]+$', username):
+        if not VerificationUtils._USERNAME_PATTERN.fullmatch(username):
             return False, "Username can only contain letters, numbers, and . _ -"
         return True, ""
 
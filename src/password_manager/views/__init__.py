@@ -5,6 +5,7 @@ Views package for the Password Manager GUI application.
 from .main_window import MainWindow
 from .auth_widget import AuthWidget
 from .dashboard_widget import DashboardWidget
+from .entries_table_model import EntriesTableModel
 from .entry_dialog import EntryDialog
 from .password_generator_dialog import PasswordGeneratorDialog
 from .change_password_dialog import ChangePasswordDialog
@@ -13,6 +14,7 @@ __all__ = [
     'MainWindow',
     'AuthWidget', 
     'DashboardWidget',
+    'EntriesTableModel',
     'EntryDialog',
     'PasswordGeneratorDialog',
     'ChangePasswordDialog'
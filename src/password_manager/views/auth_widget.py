@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit,
     QPushButton, QTabWidget, QGroupBox, QCheckBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
 
 from password_manager.controllers.password_controller import PasswordController
@@ -20,7 +20,8 @@ class AuthWidget(QWidget):
     def __init__(self):
         """Initialize the authentication widget."""
         super().__init__()
-        self.password_controller = PasswordController()
+        self.password_controller = PasswordController.shared()
+        self._last_pw_text = None
         self.setup_ui()
         self._connect_signals()
     
@@ -205,9 +206,13 @@ class AuthWidget(QWidget):
         self.register_button.clicked.connect(self._on_register_clicked)
         self.reg_confirm_edit.returnPressed.connect(self._on_register_clicked)
         
-        # Password strength monitoring
-        self.reg_password_edit.textChanged.connect(self._update_password_strength)
+        # Password strength monitoring (queued so the keystroke paints first;
+        # stale queued calls are absorbed by the unchanged-password guard)
+        self.reg_password_edit.textChanged.connect(
+            self._update_password_strength, Qt.ConnectionType.QueuedConnection
+        )
     
+    @pyqtSlot(bool)
     def _toggle_password_visibility(self, checked: bool):
         """Toggle password visibility in login tab."""
         if checked:
@@ -215,6 +220,7 @@ class AuthWidget(QWidget):
         else:
             self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
     
+    @pyqtSlot(bool)
     def _toggle_register_password_visibility(self, checked: bool):
         """Toggle password visibility in register tab."""
         if checked:
@@ -224,9 +230,15 @@ class AuthWidget(QWidget):
             self.reg_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
             self.reg_confirm_edit.setEchoMode(QLineEdit.EchoMode.Password)
     
+    @pyqtSlot()
     def _update_password_strength(self):
         """Update password strength indicator using the controller."""
         password = self.reg_password_edit.text()
+        # Skip the update if the password hasn't changed since the last check
+        if password == self._last_pw_text:
+            return
+        self._last_pw_text = password
+        
         if not password:
             self.password_strength_label.setText("Password strength: ")
             self.password_strength_label.setStyleSheet("color: #666; font-size: 10px;")
@@ -237,24 +249,16 @@ class AuthWidget(QWidget):
         
         # Update the UI based on strength info
         if strength_info['is_strong']:
-            strength_text = "Strong"
-            color = "#107c10"
+            strength_text, color = "Strong", "#107c10"
         else:
             # Determine strength level based on score
             score = strength_info.get('score', 0)
-            if score <= 2:
-                strength_text = "Weak"
-                color = "#d13438"
-            elif score <= 3:
-                strength_text = "Fair"
-                color = "#ff8c00"
-            else:
-                strength_text = "Good"
-                color = "#ffb900"
+            strength_text, color = self.password_controller.strength_level(score)
         
         self.password_strength_label.setText(f"Password strength: {strength_text}")
         self.password_strength_label.setStyleSheet(f"color: {color}; font-size: 10px; font-weight: bold;")
     
+    @pyqtSlot()
     def _on_login_clicked(self):
         """Handle login button click."""
         username = self.username_edit.text().strip()
@@ -273,6 +277,7 @@ class AuthWidget(QWidget):
         # Emit login signal
         self.login_requested.emit(username, password)
     
+    @pyqtSlot()
     def _on_register_clicked(self):
         """Handle register button click."""
         username = self.reg_username_edit.text().strip()
@@ -304,13 +309,20 @@ class AuthWidget(QWidget):
     
     def clear_fields(self):
         """Clear all input fields."""
-        self.username_edit.clear()
-        self.password_edit.clear()
-        self.reg_username_edit.clear()
-        self.reg_password_edit.clear()
-        self.reg_confirm_edit.clear()
-        self.password_strength_label.setText("Password strength: ")
-        self.password_strength_label.setStyleSheet("color: #666; font-size: 10px;")
+        # Coalesce all mutations into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            for line_edit in (self.username_edit, self.password_edit, self.reg_username_edit,
+                              self.reg_password_edit, self.reg_confirm_edit):
+                # Block signals so clearing doesn't trigger the strength check
+                line_edit.blockSignals(True)
+                line_edit.clear()
+                line_edit.blockSignals(False)
+            self.password_strength_label.setText("Password strength: ")
+            self.password_strength_label.setStyleSheet("color: #666; font-size: 10px;")
+            self._last_pw_text = None
+        finally:
+            self.setUpdatesEnabled(True)
     
     def set_login_focus(self):
         """Set focus to login tab."""
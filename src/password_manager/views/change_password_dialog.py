@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit,
     QPushButton, QCheckBox, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtGui import QFont
 
 from password_manager.controllers.password_controller import PasswordController
@@ -17,7 +17,10 @@ class ChangePasswordDialog(QDialog):
     def __init__(self, parent=None):
         """Initialize the change password dialog."""
         super().__init__(parent)
-        self.password_controller = PasswordController()
+        self.password_controller = PasswordController.shared()
+        self._last_strength_pw = None
+        self._last_strength_info = None
+        self._last_pw_text = None
         self.setup_ui()
         self._connect_signals()
     
@@ -154,13 +157,19 @@ class ChangePasswordDialog(QDialog):
         self.change_button.clicked.connect(self._on_change_clicked)
         self.cancel_button.clicked.connect(self.reject)
         
-        # Password field signals
-        self.new_password_edit.textChanged.connect(self._update_password_strength)
-        self.confirm_password_edit.textChanged.connect(self._update_password_strength)
+        # Password field signals (queued so the keystroke paints first;
+        # stale queued calls are absorbed by the unchanged-password guard)
+        self.new_password_edit.textChanged.connect(
+            self._update_password_strength, Qt.ConnectionType.QueuedConnection
+        )
+        self.confirm_password_edit.textChanged.connect(
+            self._update_password_strength, Qt.ConnectionType.QueuedConnection
+        )
         
         # Enter key in confirm field triggers change
         self.confirm_password_edit.returnPressed.connect(self._on_change_clicked)
     
+    @pyqtSlot(bool)
     def _toggle_password_visibility(self, checked: bool):
         """Toggle password visibility."""
         if checked:
@@ -172,9 +181,15 @@ class ChangePasswordDialog(QDialog):
             self.new_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
             self.confirm_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
     
+    @pyqtSlot()
     def _update_password_strength(self):
         """Update password strength indicator using the controller."""
         password = self.new_password_edit.text()
+        # Skip the update if the password hasn't changed since the last check
+        if password == self._last_pw_text:
+            return
+        self._last_pw_text = password
+        
         if not password:
             self.strength_label.setText("Password strength: ")
             self.strength_label.setStyleSheet("color: #666; font-size: 10px;")
@@ -190,23 +205,16 @@ class ChangePasswordDialog(QDialog):
         
         # Use the password controller to check strength
         strength_info = self.password_controller.check_password_strength(password)
+        self._last_strength_pw = password
+        self._last_strength_info = strength_info
         
         # Update strength label
         if strength_info['is_strong']:
-            strength_text = "Strong"
-            color = "#107c10"
+            strength_text, color = "Strong", "#107c10"
         else:
             # Determine strength level based on score
             score = strength_info.get('score', 0)
-            if score <= 2:
-                strength_text = "Weak"
-                color = "#d13438"
-            elif score <= 3:
-                strength_text = "Fair"
-                color = "#ff8c00"
-            else:
-                strength_text = "Good"
-                color = "#ffb900"
+            strength_text, color = self.password_controller.strength_level(score)
         
         self.strength_label.setText(f"Password strength: {strength_text}")
         self.strength_label.setStyleSheet(f"color: {color}; font-size: 10px; font-weight: bold;")
@@ -221,6 +229,7 @@ class ChangePasswordDialog(QDialog):
             self.requirements_text.setText("All requirements met ✓")
             self.requirements_text.setStyleSheet("color: #107c10; font-size: 9px; margin-left: 10px; font-weight: bold;")
     
+    @pyqtSlot()
     def _on_change_clicked(self):
         """Handle change password button click."""
         # Validate inputs
@@ -248,8 +257,11 @@ class ChangePasswordDialog(QDialog):
             self.confirm_password_edit.setFocus()
             return
         
-        # Check password strength
-        strength_info = self.password_controller.check_password_strength(new_password)
+        # Check password strength, reusing the result computed while typing
+        if self._last_strength_pw == new_password:
+            strength_info = self._last_strength_info
+        else:
+            strength_info = self.password_controller.check_password_strength(new_password)
         if not strength_info['is_strong']:
             QMessageBox.warning(self, "Weak Password", 
                               "Please choose a stronger password that meets all requirements.")
@@ -259,6 +271,17 @@ class ChangePasswordDialog(QDialog):
         # Accept the dialog
         self.accept()
     
+    def clear_fields(self):
+        """Clear all password fields so the dialog can be reused."""
+        for line_edit in (self.current_password_edit, self.new_password_edit, self.confirm_password_edit):
+            line_edit.clear()
+        self.show_passwords_checkbox.setChecked(False)
+        # Drop the cached strength result along with the password it was computed for
+        self._last_strength_pw = None
+        self._last_strength_info = None
+        self._last_pw_text = None
+        self.current_password_edit.setFocus()
+    
     def get_passwords(self) -> tuple:
         """Get the password values from the dialog.
         
@@ -2,15 +2,17 @@
 Dashboard widget for managing password entries.
 """
 
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QLineEdit, QComboBox,
+    QTableView, QHeaderView, QLineEdit, QComboBox,
     QGroupBox, QAbstractItemView, QMenu, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QModelIndex, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont, QCursor, QAction
 
 from password_manager.controllers.search_controller import SearchController
+from password_manager.views.entries_table_model import EntriesTableModel
 
 class DashboardWidget(QWidget):
     """Dashboard widget for managing password entries."""
@@ -22,12 +24,203 @@ class DashboardWidget(QWidget):
     copy_password_requested = pyqtSignal(int)
     generate_password_requested = pyqtSignal()
     
+    # Delay before a burst of search keystrokes is applied
+    _SEARCH_DEBOUNCE_MS = 200
+    
+    # How long a copied password may stay on the clipboard
+    _CLIPBOARD_CLEAR_MS = 20000
+    
+    # Welcome header font, shared by all instances
+    _HEADER_FONT = QFont()
+    _HEADER_FONT.setPointSize(18)
+    _HEADER_FONT.setBold(True)
+    
+    # Stylesheets are built once per class and shared by all instances
+    _CLEAR_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #f8f9fa;
+            color: #6c757d;
+            border: 1px solid #dee2e6;
+            border-radius: 6px;
+            font-size: 12px;
+            font-weight: 500;
+            padding: 6px 12px;
+        }
+        QPushButton:hover {
+            background-color: #e9ecef;
+            color: #495057;
+            border-color: #adb5bd;
+        }
+        QPushButton:pressed {
+            background-color: #dee2e6;
+            color: #343a40;
+        }
+    """
+    
+    _TABLE_STYLE = """
+        QTableView {
+            background-color: #1e1e1e;
+            gridline-color: #3a3a3a;
+            border: 1px solid #3a3a3a;
+            alternate-background-color: #252526;
+        }
+
+        QTableView::item {
+            color: #dcdcdc;
+            padding: 5px;
+            border: none;
+        }
+
+        QTableView::item:selected {
+            background-color: #264f78;
+            color: #ffffff;
+        }
+
+        QTableView::item:hover {
+            background-color: #373737;
+            color: #ffffff;
+        }
+
+        QHeaderView::section {
+            background-color: #2a2d2e;
+            color: #e0e0e0;
+            padding: 6px;
+            border: 1px solid #3a3a3a;
+            font-weight: bold;
+        }
+    """
+    
+    _ENTRY_COUNT_STYLE = "color: #666; font-style: italic;"
+    
+    _MAIN_BUTTON_STYLE = """
+        QPushButton {
+            border: 2px solid #e0e0e0;
+            border-radius: 8px;
+            font-size: 14px;
+            font-weight: 600;
+            padding: 12px 24px;
+            min-height: 44px;
+        }
+        QPushButton:hover {
+            border-color: #0078d4;
+            background-color: #f0f8ff;
+            transform: translateY(-1px);
+        }
+        QPushButton:pressed {
+            background-color: #e0e0e0;
+            border-color: #0078d4;
+            transform: translateY(0px);
+        }
+        QPushButton:disabled {
+            background-color: #f5f5f5;
+            color: #999;
+            border-color: #e0e0e0;
+        }
+    """
+    
+    _ADD_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #d4edda;
+            color: #155724;
+        }
+        QPushButton:hover {
+            background-color: #c3e6cb;
+            color: #0f5132;
+        }
+    """
+    
+    _GENERATE_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #e3f2fd;
+            color: #1976d2;
+        }
+        QPushButton:hover {
+            background-color: #bbdefb;
+            color: #1565c0;
+        }
+    """
+    
+    _VIEW_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #f8f9fa;
+            color: #495057;
+        }
+        QPushButton:hover {
+            background-color: #e3f2fd;
+            color: #1976d2;
+        }
+    """
+    
+    _EDIT_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #fff3cd;
+            color: #856404;
+        }
+        QPushButton:hover {
+            background-color: #ffeaa7;
+            color: #6c5ce7;
+        }
+    """
+    
+    _COPY_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #d4edda;
+            color: #155724;
+        }
+        QPushButton:hover {
+            background-color: #c3e6cb;
+            color: #0f5132;
+        }
+    """
+    
+    _DELETE_BUTTON_STYLE = _MAIN_BUTTON_STYLE + """
+        QPushButton {
+            background-color: #f8d7da;
+            color: #721c24;
+        }
+        QPushButton:hover {
+            background-color: #f5c6cb;
+            color: #491217;
+        }
+    """
+    
+    # Action bar button styles scoped by object name, so one sheet is parsed for all of them
+    _ACTION_BAR_STYLE = "".join(
+        style.replace("QPushButton", f"QPushButton#{name}")
+        for name, style in (
+            ("addEntryButton", _ADD_BUTTON_STYLE),
+            ("generatePasswordButton", _GENERATE_BUTTON_STYLE),
+            ("viewEntryButton", _VIEW_BUTTON_STYLE),
+            ("editEntryButton", _EDIT_BUTTON_STYLE),
+            ("copyPasswordButton", _COPY_BUTTON_STYLE),
+            ("deleteEntryButton", _DELETE_BUTTON_STYLE),
+        )
+    )
+    
     def __init__(self):
         """Initialize the dashboard widget."""
         super().__init__()
         self.entries = []
         self.filtered_entries = []
+        self._entries_by_id = {}
+        self._current_entry_id = None
+        self._ctx_target_id = None
+        self._last_filter_key = None
         self.search_controller = SearchController()
+        self._search_index = self.search_controller.build_search_index(self.entries)
+        
+        # Coalesce search keystrokes into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self._SEARCH_DEBOUNCE_MS)
+        
+        # Copied passwords are wiped from the clipboard after a delay
+        self._clipboard = QApplication.clipboard()
+        self._copied_password = None
+        self._clipboard_timer = QTimer(self)
+        self._clipboard_timer.setSingleShot(True)
+        self._clipboard_timer.setInterval(self._CLIPBOARD_CLEAR_MS)
+        
         self.setup_ui()
         self._connect_signals()
     
@@ -56,10 +249,7 @@ class DashboardWidget(QWidget):
         
         # Welcome message
         welcome_label = QLabel("Your Vault is Ready – We're Keeping Your Logins Safe!")
-        welcome_font = QFont()
-        welcome_font.setPointSize(18)
-        welcome_font.setBold(True)
-        welcome_label.setFont(welcome_font)
+        welcome_label.setFont(self._HEADER_FONT)
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(welcome_label, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -90,26 +280,7 @@ class DashboardWidget(QWidget):
         # Clear search button
         self.clear_search_button = QPushButton("🗑 Clear")
         self.clear_search_button.setMinimumHeight(32)
-        self.clear_search_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f8f9fa;
-                color: #6c757d;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-                color: #495057;
-                border-color: #adb5bd;
-            }
-            QPushButton:pressed {
-                background-color: #dee2e6;
-                color: #343a40;
-            }
-        """)
+        self.clear_search_button.setStyleSheet(self._CLEAR_BUTTON_STYLE)
         search_layout.addWidget(self.clear_search_button)
         
         parent_layout.addWidget(search_group)
@@ -119,64 +290,32 @@ class DashboardWidget(QWidget):
         table_group = QGroupBox("Password Entries")
         table_layout = QVBoxLayout(table_group)
         
-        # Table
-        self.entries_table = QTableWidget()
-        self.entries_table.setColumnCount(3)
-        self.entries_table.setHorizontalHeaderLabels([
-            "ID", "Address/Name", "Actions"
-        ])
+        # Table (rows are rendered lazily from the model)
+        self.entries_model = EntriesTableModel(self)
+        self.entries_table = QTableView()
+        self.entries_table.setModel(self.entries_model)
         
         # Table properties
         self.entries_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.entries_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.entries_table.setAlternatingRowColors(True)
         self.entries_table.setSortingEnabled(True)
+        self.entries_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         self.entries_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._ctx_menu = self._create_context_menu()
 
         # Table style
-        self.entries_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                gridline-color: #3a3a3a;
-                border: 1px solid #3a3a3a;
-                alternate-background-color: #252526;
-            }
-
-            QTableWidget::item {
-                color: #dcdcdc;
-                padding: 5px;
-                border: none;
-            }
-
-            QTableWidget::item:selected {
-                background-color: #264f78;
-                color: #ffffff;
-            }
+        self.entries_table.setStyleSheet(self._TABLE_STYLE)
 
-            QTableWidget::item:hover {
-                background-color: #373737;
-                color: #ffffff;
-            }
-
-            QHeaderView::section {
-                background-color: #2a2d2e;
-                color: #e0e0e0;
-                padding: 6px;
-                border: 1px solid #3a3a3a;
-                font-weight: bold;
-            }
-        """)
-
-        # Column widths
+        # Column widths (the entry id travels as UserRole data, not as a column)
         header = self.entries_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Address/Name
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Actions
-        self.entries_table.setColumnWidth(2, 220)  # Ensure actions column is wide enough
-        
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Address/Name
         
-        # Hide ID column by default
-        self.entries_table.hideColumn(0)
+        # Row height is set once here rather than per row while populating;
+        # fixed sections also spare the view from querying per-row size hints
+        vertical_header = self.entries_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(50)
         
         # Hide the horizontal header completely
         self.entries_table.horizontalHeader().setVisible(False)
@@ -185,7 +324,7 @@ class DashboardWidget(QWidget):
         
         # Entry count label
         self.entry_count_label = QLabel("No entries found")
-        self.entry_count_label.setStyleSheet("color: #666; font-style: italic;")
+        self.entry_count_label.setStyleSheet(self._ENTRY_COUNT_STYLE)
         table_layout.addWidget(self.entry_count_label)
         
         parent_layout.addWidget(table_group)
@@ -196,63 +335,49 @@ class DashboardWidget(QWidget):
         actions_layout.setSpacing(8)
         actions_layout.setContentsMargins(0, 10, 0, 10)
         
-        # Common button styles for main action buttons
-        main_button_style = """
-            QPushButton {
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 12px 24px;
-                min-height: 44px;
-            }
-            QPushButton:hover {
-                border-color: #0078d4;
-                background-color: #f0f8ff;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-                border-color: #0078d4;
-                transform: translateY(0px);
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #999;
-                border-color: #e0e0e0;
-            }
-        """
+        # Styles for every action button, matched by object name
+        self.setStyleSheet(self._ACTION_BAR_STYLE)
         
         # Add entry button
         self.add_entry_button = QPushButton("➕ Add New Entry")
-        self.add_entry_button.setStyleSheet(main_button_style + """
-            QPushButton {
-                background-color: #d4edda;
-                color: #155724;
-            }
-            QPushButton:hover {
-                background-color: #c3e6cb;
-                color: #0f5132;
-            }
-        """)
+        self.add_entry_button.setObjectName("addEntryButton")
         actions_layout.addWidget(self.add_entry_button)
         
         # Generate password button
         self.generate_password_button = QPushButton("🔐 Generate Password")
-        self.generate_password_button.setStyleSheet(main_button_style + """
-            QPushButton {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-            QPushButton:hover {
-                background-color: #bbdefb;
-                color: #1565c0;
-            }
-        """)
+        self.generate_password_button.setObjectName("generatePasswordButton")
         # actions_layout.addWidget(self.generate_password_button)
         
         actions_layout.addStretch()
         
+        # Selected entry actions (shared by all rows, enabled by the table selection)
+        self.view_entry_button = QPushButton("View")
+        self.view_entry_button.setToolTip("View entry details")
+        self.view_entry_button.setObjectName("viewEntryButton")
+        actions_layout.addWidget(self.view_entry_button)
+        
+        self.edit_entry_button = QPushButton("Edit")
+        self.edit_entry_button.setToolTip("Edit entry")
+        self.edit_entry_button.setObjectName("editEntryButton")
+        actions_layout.addWidget(self.edit_entry_button)
+        
+        self.copy_password_button = QPushButton("Copy")
+        self.copy_password_button.setToolTip("Copy password to clipboard")
+        self.copy_password_button.setObjectName("copyPasswordButton")
+        actions_layout.addWidget(self.copy_password_button)
+        
+        self.delete_entry_button = QPushButton("Delete")
+        self.delete_entry_button.setToolTip("Delete entry")
+        self.delete_entry_button.setObjectName("deleteEntryButton")
+        actions_layout.addWidget(self.delete_entry_button)
+        
+        self._selection_buttons = (
+            self.view_entry_button, self.edit_entry_button,
+            self.copy_password_button, self.delete_entry_button
+        )
+        for button in self._selection_buttons:
+            button.setEnabled(False)
+        
         parent_layout.addLayout(actions_layout)
     
     def _connect_signals(self):
@@ -261,28 +386,48 @@ class DashboardWidget(QWidget):
         self.add_entry_button.clicked.connect(self.add_entry_requested.emit)
         self.generate_password_button.clicked.connect(self.generate_password_requested.emit)
         self.clear_search_button.clicked.connect(self._clear_search)
+        self.view_entry_button.clicked.connect(self._on_view_selected_clicked)
+        self.edit_entry_button.clicked.connect(self._on_edit_selected_clicked)
+        self.copy_password_button.clicked.connect(self._on_copy_selected_clicked)
+        self.delete_entry_button.clicked.connect(self._on_delete_selected_clicked)
         
         # Search and filter signals
-        self.search_edit.textChanged.connect(self._apply_search_filter)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
+        self._filter_timer.timeout.connect(self._apply_search_filter)
+        self._clipboard_timer.timeout.connect(self._clear_copied_password)
         self.filter_combo.currentTextChanged.connect(self._apply_search_filter)
         
         # Table signals
         self.entries_table.customContextMenuRequested.connect(self._show_context_menu)
-        self.entries_table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.entries_table.doubleClicked.connect(self._on_item_double_clicked)
+        self.entries_table.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
     
     def update_entries(self, entries: list[dict]):
         """Update the entries table with new data."""
         self.entries = entries
+        self._entries_by_id = {entry.get('id'): entry for entry in entries}
+        # Lowercase the searchable fields once here instead of on every keystroke
+        self._search_index = self.search_controller.build_search_index(entries)
+        # New data must be filtered even if the search inputs are unchanged
+        self._last_filter_key = None
         self._apply_search_filter()
     
     def _apply_search_filter(self):
         """Apply search and filter to entries using the controller."""
+        # Any pending debounced search is superseded by this pass
+        self._filter_timer.stop()
         search_text = self.search_edit.text()
         filter_field = self.filter_combo.currentText()
         
+        # Nothing to do if the criteria match the last applied filter
+        filter_key = (search_text, filter_field)
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+        
         # Use the search controller to filter entries
         self.filtered_entries = self.search_controller.filter_entries(
-            self.entries, search_text, filter_field
+            self.entries, search_text, filter_field, self._search_index
         )
         
         # Update the table and count
@@ -291,126 +436,18 @@ class DashboardWidget(QWidget):
     
     def _populate_table(self):
         """Populate the table with filtered entries."""
-        self.entries_table.setRowCount(len(self.filtered_entries))
-        min_row_height = 50  # Ensure enough height for buttons
-        for row, entry in enumerate(self.filtered_entries):
-            # ID column
-            id_item = QTableWidgetItem(str(entry.get('id', '')))
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.entries_table.setItem(row, 0, id_item)
-            
-            # Name/Address column
-            name = entry.get('Name', '')
-            address = entry.get('Address', '')
-            display_text = f"{name} - {address}" if address else name
-            name_item = QTableWidgetItem(display_text)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.entries_table.setItem(row, 1, name_item)
-            
-            # Actions column
-            actions_widget = self._create_actions_widget(entry.get('id'), entry)
-            self.entries_table.setCellWidget(row, 2, actions_widget)
-            self.entries_table.setRowHeight(row, min_row_height)
-    
-    def _create_actions_widget(self, entry_id: int, entry: dict) -> QWidget:
-        """Create the actions widget for a table row."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(6)
-        
-        # Common button styles
-        base_style = """
-            QPushButton {
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: 500;
-                
-                min-height: 28px;
-                min-width: 32px;
-            }
-            QPushButton:hover {
-                border-color: #0078d4;
-                background-color: #f0f8ff;
-            }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-                border-color: #0078d4;
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #999;
-                border-color: #e0e0e0;
-            }
-        """
-        
-        # View button
-        view_button = QPushButton("View")
-        view_button.setToolTip("View entry details")
-        view_button.setStyleSheet(base_style + """
-            QPushButton {
-                background-color: #f8f9fa;
-                color: #495057;
-            }
-            QPushButton:hover {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-        """)
-        view_button.clicked.connect(lambda: self._on_view_entry_clicked(entry_id))
-        layout.addWidget(view_button)
-        
-        # Edit button
-        edit_button = QPushButton("Edit")
-        edit_button.setToolTip("Edit entry")
-        edit_button.setStyleSheet(base_style + """
-            QPushButton {
-                background-color: #fff3cd;
-                color: #856404;
-            }
-            QPushButton:hover {
-                background-color: #ffeaa7;
-                color: #6c5ce7;
-            }
-        """)
-        edit_button.clicked.connect(lambda: self._on_edit_entry_clicked(entry_id))
-        layout.addWidget(edit_button)
-        
-        # Copy password button
-        copy_button = QPushButton("Copy")
-        copy_button.setToolTip("Copy password to clipboard")
-        copy_button.setStyleSheet(base_style + """
-            QPushButton {
-                background-color: #d4edda;
-                color: #155724;
-            }
-            QPushButton:hover {
-                background-color: #c3e6cb;
-                color: #0f5132;
-            }
-        """)
-        copy_button.clicked.connect(lambda: self._on_copy_password_clicked(entry))
-        layout.addWidget(copy_button)
-        
-        # Delete button
-        delete_button = QPushButton("Delete")
-        delete_button.setToolTip("Delete entry")
-        delete_button.setStyleSheet(base_style + """
-            QPushButton {
-                background-color: #f8d7da;
-                color: #721c24;
-            }
-            QPushButton:hover {
-                background-color: #f5c6cb;
-                color: #491217;
-            }
-        """)
-        delete_button.clicked.connect(lambda: self._on_delete_entry_clicked(entry_id))
-        layout.addWidget(delete_button)
-        
-        layout.addStretch()
-        return widget
+        # Repaint once after the whole batch of row inserts/removals
+        self.entries_table.setUpdatesEnabled(False)
+        try:
+            self.entries_model.set_entries(self.filtered_entries)
+        finally:
+            self.entries_table.setUpdatesEnabled(True)
+    
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Track the selected entry and enable the selection actions."""
+        self._current_entry_id = current.data(Qt.ItemDataRole.UserRole) if current.isValid() else None
+        for button in self._selection_buttons:
+            button.setEnabled(self._current_entry_id is not None)
     
     def _update_entry_count(self):
         """Update the entry count label using the controller."""
@@ -419,80 +456,89 @@ class DashboardWidget(QWidget):
     
     def _clear_search(self):
         """Clear search and filter."""
-        self.search_edit.clear()
-        self.filter_combo.setCurrentText("All")
-        # Use the controller to clear search
-        self.filtered_entries = self.search_controller.clear_search(self.entries)
-        self._populate_table()
-        self._update_entry_count()
+        # Reset both inputs silently, then filter once
+        with QSignalBlocker(self.search_edit), QSignalBlocker(self.filter_combo):
+            self.search_edit.clear()
+            self.filter_combo.setCurrentText("All")
+        self._apply_search_filter()
     
     def _show_context_menu(self, position):
         """Show context menu for table items."""
-        item = self.entries_table.itemAt(position)
-        if not item:
+        index = self.entries_table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
-        entry_id_item = self.entries_table.item(row, 0)
-        if not entry_id_item:
-            return
-        
-        try:
-            entry_id = int(entry_id_item.text())
-        except ValueError:
+        entry_id = index.data(Qt.ItemDataRole.UserRole)
+        if entry_id is None:
             return
         
+        # The menu is built once; its actions act on the current target id
+        self._ctx_target_id = entry_id
+        self._ctx_menu.exec(QCursor.pos())
+    
+    def _create_context_menu(self) -> QMenu:
+        """Create the table context menu."""
         menu = QMenu(self)
         
         # View action
         view_action = QAction("View Entry", self)
-        view_action.triggered.connect(lambda: self._on_view_entry_clicked(entry_id))
+        view_action.triggered.connect(partial(self._on_context_action, self._on_view_entry_clicked))
         menu.addAction(view_action)
         
         # Edit action
         edit_action = QAction("Edit Entry", self)
-        edit_action.triggered.connect(lambda: self._on_edit_entry_clicked(entry_id))
+        edit_action.triggered.connect(partial(self._on_context_action, self._on_edit_entry_clicked))
         menu.addAction(edit_action)
         
         menu.addSeparator()
         
         # Copy password action
         copy_action = QAction("Copy Password", self)
-        copy_action.triggered.connect(lambda: self._copy_password_to_clipboard(
-            next((e for e in self.filtered_entries if e.get('id') == entry_id), {})
-        ))
+        copy_action.triggered.connect(partial(self._on_context_action, self._copy_password_by_id))
         menu.addAction(copy_action)
         
         menu.addSeparator()
         
         # Delete action
         delete_action = QAction("Delete Entry", self)
-        delete_action.triggered.connect(lambda: self._on_delete_entry_clicked(entry_id))
+        delete_action.triggered.connect(partial(self._on_context_action, self._on_delete_entry_clicked))
         menu.addAction(delete_action)
         
-        menu.exec(QCursor.pos())
+        return menu
+    
+    def _on_context_action(self, handler):
+        """Run a context menu action handler for the entry the menu was opened on."""
+        if self._ctx_target_id is not None:
+            handler(self._ctx_target_id)
     
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """Handle double-click on table item."""
-        row = item.row()
-        entry_id_item = self.entries_table.item(row, 0)
-        if entry_id_item:
-            try:
-                entry_id = int(entry_id_item.text())
-                self._on_view_entry_clicked(entry_id)
-            except ValueError:
-                pass
+        entry_id = index.data(Qt.ItemDataRole.UserRole)
+        if entry_id is not None:
+            self._on_view_entry_clicked(entry_id)
     
     def _copy_password_to_clipboard(self, entry: dict):
         """Copy password to clipboard."""
         password = entry.get('Password', '')
         if password:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(password)
+            self._clipboard.setText(password)
+            self._copied_password = password
+            self._clipboard_timer.start()
             self._show_status_message("Password copied to clipboard!", 2000)
         else:
             self._show_status_message("No password to copy", 2000)
     
+    def _clear_copied_password(self):
+        """Clear the clipboard if it still holds the copied password."""
+        # Leave it alone if the user has copied something else since
+        if self._clipboard.text() == self._copied_password:
+            self._clipboard.clear()
+        self._copied_password = None
+    
+    def _copy_password_by_id(self, entry_id: int):
+        """Copy the password of the entry with the given id."""
+        self._copy_password_to_clipboard(self._entries_by_id.get(entry_id, {}))
+    
     def _show_status_message(self, message: str, timeout: int = 0):
         """Show a status message (placeholder for future implementation)."""
         # This could be connected to a status bar or notification system
@@ -502,6 +548,26 @@ class DashboardWidget(QWidget):
         """Handle copy password button click."""
         self._copy_password_to_clipboard(entry)
     
+    def _on_view_selected_clicked(self):
+        """Handle view button click for the selected entry."""
+        if self._current_entry_id is not None:
+            self._on_view_entry_clicked(self._current_entry_id)
+    
+    def _on_edit_selected_clicked(self):
+        """Handle edit button click for the selected entry."""
+        if self._current_entry_id is not None:
+            self._on_edit_entry_clicked(self._current_entry_id)
+    
+    def _on_copy_selected_clicked(self):
+        """Handle copy button click for the selected entry."""
+        if self._current_entry_id is not None:
+            self._on_copy_password_clicked(self._entries_by_id.get(self._current_entry_id, {}))
+    
+    def _on_delete_selected_clicked(self):
+        """Handle delete button click for the selected entry."""
+        if self._current_entry_id is not None:
+            self._on_delete_entry_clicked(self._current_entry_id)
+    
     def _on_view_entry_clicked(self, entry_id: int):
         """Handle view entry button click."""
         self.view_entry_requested.emit(entry_id)
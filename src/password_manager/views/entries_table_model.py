@@ -0,0 +1,161 @@
+"""
+Table model exposing password entries to the dashboard's entries view.
+"""
+
+from operator import itemgetter
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+class EntriesTableModel(QAbstractTableModel):
+    """Read-only table model backed by a list of entry dictionaries."""
+
+    HEADERS = ("Address/Name",)
+
+    # Above this many separate removed/inserted row runs, one model reset is cheaper
+    # than a begin/end signal pair (and a list splice) per run
+    MAX_INCREMENTAL_RUNS = 32
+
+    def __init__(self, parent=None):
+        """Initialize the entries table model.
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        # (entry, display text) pairs; the text is built once per entry update
+        self._rows: list[tuple[dict, str]] = []
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_entries(self, entries: list[dict]) -> None:
+        """Update the displayed entries, touching only the rows that changed."""
+        new_rows = self._sorted([(entry, self._display_text(entry)) for entry in entries])
+        old_ids = [entry.get('id') for entry, _ in self._rows]
+        new_ids = [entry.get('id') for entry, _ in new_rows]
+        if old_ids == new_ids:
+            # Same rows in the same order; at most their contents changed
+            self._refresh_rows(0, new_rows)
+            return
+
+        old_id_set = set(old_ids)
+        new_id_set = set(new_ids)
+        removed_runs = self._runs([position for position, entry_id in enumerate(old_ids)
+                                   if entry_id not in new_id_set])
+        inserted_runs = self._runs([position for position, entry_id in enumerate(new_ids)
+                                    if entry_id not in old_id_set])
+        # The diff needs unique ids, and kept rows already in their new relative order
+        diffable = (len(old_id_set) == len(old_ids) and len(new_id_set) == len(new_ids)
+                    and [entry_id for entry_id in old_ids if entry_id in new_id_set]
+                    == [entry_id for entry_id in new_ids if entry_id in old_id_set])
+        if not diffable or len(removed_runs) + len(inserted_runs) > self.MAX_INCREMENTAL_RUNS:
+            self.beginResetModel()
+            self._rows = new_rows
+            self.endResetModel()
+            return
+
+        # Remove from the end so the row numbers of earlier runs stay valid
+        for first, last in reversed(removed_runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        # Insert in ascending order; every row before each run is then already in its new place
+        for first, last in inserted_runs:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._rows[first:first] = new_rows[first:last + 1]
+            self.endInsertRows()
+        self._refresh_rows(0, new_rows)
+
+    @staticmethod
+    def _runs(positions: list[int]) -> list[tuple[int, int]]:
+        """Group ascending row positions into (first, last) runs of consecutive rows."""
+        runs = []
+        for position in positions:
+            if runs and runs[-1][1] == position - 1:
+                runs[-1] = (runs[-1][0], position)
+            else:
+                runs.append((position, position))
+        return runs
+
+    def _refresh_rows(self, first: int, rows: list[tuple[dict, str]]) -> None:
+        """Swap in updated data for rows whose ids did not change."""
+        changed = [
+            offset for offset, row in enumerate(rows)
+            if self._rows[first + offset] != row
+        ]
+        self._rows[first:first + len(rows)] = rows
+        if changed:
+            self.dataChanged.emit(
+                self.index(first + changed[0], 0),
+                self.index(first + changed[-1], self.columnCount() - 1)
+            )
+
+    def entry_at(self, row: int) -> dict | None:
+        """Get the entry displayed at the given row."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of displayed entries."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Get the display text for a row, or the entry id for the user role."""
+        if not index.isValid():
+            return None
+
+        entry, display_text = self._rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return entry.get('id')
+        # Only the display and user roles are served; everything else falls back to defaults
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display_text
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        """Get the header labels."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Entries are selectable but not editable in place."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the entries by the given column."""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_rows = [self._rows[index.row()] for index in old_indexes]
+
+        self._sort_column = column
+        self._sort_order = order
+        self._rows = self._sorted(self._rows)
+
+        # Keep persistent indexes (selection, index widgets) attached to their entries
+        new_positions = {id(row): position for position, row in enumerate(self._rows)}
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_positions[id(row)], index.column())
+            for row, index in zip(old_rows, old_indexes)
+        ])
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def _display_text(entry: dict) -> str:
+        """Build the 'Name - Address' text shown for an entry."""
+        name = entry.get('Name', '')
+        address = entry.get('Address', '')
+        return f"{name} - {address}" if address else name
+
+    def _sorted(self, rows: list[tuple[dict, str]]) -> list[tuple[dict, str]]:
+        """Get the rows ordered by the current sort column and order."""
+        if self._sort_column != 0:
+            return list(rows)
+        return sorted(rows, key=itemgetter(1),
+                      reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit,
     QPushButton, QTextEdit, QCheckBox, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
 from password_manager.controllers.input_validator import InputValidator
@@ -14,6 +14,34 @@ from password_manager.controllers.input_validator import InputValidator
 class EntryDialog(QDialog):
     """Dialog for adding or editing password entries."""
     
+    # Window in which repeated save clicks/Enter presses are ignored
+    _SAVE_THROTTLE_MS = 250
+    
+    # Button styles matched by object name, applied once on the dialog
+    _BUTTON_STYLE = """
+        QPushButton#cancelButton {
+            background-color: #666;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 8px 16px;
+        }
+        QPushButton#cancelButton:hover {
+            background-color: #555;
+        }
+        QPushButton#saveButton {
+            background-color: #107c10;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 8px 16px;
+            font-weight: bold;
+        }
+        QPushButton#saveButton:hover {
+            background-color: #0e6e0e;
+        }
+    """
+    
     def __init__(self, parent=None, entry: dict | None = None):
         """Initialize the entry dialog.
         
@@ -26,17 +54,43 @@ class EntryDialog(QDialog):
         self.is_editing = entry is not None
         self.validator = InputValidator()
         
+        # Leading-edge throttle: the first save request runs, repeats are dropped
+        self._save_throttle = QTimer(self)
+        self._save_throttle.setSingleShot(True)
+        self._save_throttle.setInterval(self._SAVE_THROTTLE_MS)
+        
         self.setup_ui()
         self._connect_signals()
+        self.reset(entry)
+    
+    def reset(self, entry: dict | None = None):
+        """Prepare the dialog for a new entry or for editing an existing one.
+        
+        Args:
+            entry: Existing entry data for editing (None for new entry)
+        """
+        self.entry = entry
+        self.is_editing = entry is not None
+        self.setWindowTitle("Edit Entry" if self.is_editing else "➕Add New Entry")
+        self.save_button.setText("Save" if self.is_editing else "Add Entry")
+        self._save_throttle.stop()
+        
+        # Clear anything left over from the previous use of the dialog
+        for line_edit in (self.name_edit, self.address_edit, self.username_edit, self.password_edit):
+            line_edit.clear()
+        self.notes_edit.clear()
+        self.show_password_checkbox.setChecked(False)
         
         if self.is_editing:
             self._populate_fields()
+        self.name_edit.setFocus()
     
     def setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("Edit Entry" if self.is_editing else "➕Add New Entry")
         self.setMinimumSize(500, 400)
         self.setModal(True)
+        self.setStyleSheet(self._BUTTON_STYLE)
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -101,37 +155,14 @@ class EntryDialog(QDialog):
         
         # Cancel button
         self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setObjectName("cancelButton")
         self.cancel_button.setMinimumHeight(35)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #666;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-        """)
         button_layout.addWidget(self.cancel_button)
         
         # Save button
         self.save_button = QPushButton("Save" if self.is_editing else "Add Entry")
+        self.save_button.setObjectName("saveButton")
         self.save_button.setMinimumHeight(35)
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #107c10;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0e6e0e;
-            }
-        """)
         button_layout.addWidget(self.save_button)
         
         main_layout.addLayout(button_layout)
@@ -164,6 +195,10 @@ class EntryDialog(QDialog):
     
     def _on_save_clicked(self):
         """Handle save button click."""
+        if self._save_throttle.isActive():
+            return
+        self._save_throttle.start()
+        
         # Get form data
         name = self.name_edit.text().strip()
         address = self.address_edit.text().strip()
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QStackedWidget,
     QStatusBar, QApplication, QMessageBox
 )
-from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction
 
 from password_manager.views.auth_widget import AuthWidget
@@ -19,6 +19,9 @@ from password_manager.views.change_password_dialog import ChangePasswordDialog
 class MainWindow(QMainWindow):
     """Main window for the password manager application."""
     
+    # Minimum time between status bar repaints during bursts of entry updates (~30 Hz)
+    _STATUS_FLUSH_MS = 33
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -26,6 +29,17 @@ class MainWindow(QMainWindow):
         self.controller = None  # Will be set by the controller
         self.current_entries = []
         self.current_username = None
+        # Dialogs are created on first use, then reused
+        self._entry_dialog = None
+        self._password_generator_dialog = None
+        self._change_password_dialog = None
+        
+        # Newest status message waiting to be shown; bursts are flushed at most once per interval
+        self._status_pending: tuple[str, int] | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self._STATUS_FLUSH_MS)
+        self._status_timer.timeout.connect(self._flush_status)
         
         self.setup_ui()
         self.setup_menu()
@@ -90,7 +104,6 @@ class MainWindow(QMainWindow):
         self.change_password_action.setShortcut("Ctrl+P")
         self.change_password_action.setStatusTip("Change master password")
         self.change_password_action.triggered.connect(self._on_change_password_requested)
-        self.change_password_action.setEnabled(False)
         self.user_menu.addAction(self.change_password_action)
         
         # Logout action
@@ -98,9 +111,12 @@ class MainWindow(QMainWindow):
         self.logout_action.setShortcut("Ctrl+L")
         self.logout_action.setStatusTip("Logout from the application")
         self.logout_action.triggered.connect(self._on_logout_requested)
-        self.logout_action.setEnabled(False) 
         self.user_menu.addAction(self.logout_action)
         
+        # The user actions stay enabled; their handlers refuse to run while logged out
+        for action in (self.change_password_action, self.logout_action):
+            action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        
         # Tools menu
         tools_menu = menubar.addMenu("&Tools")
         
@@ -126,6 +142,19 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
     
+    def _post_status(self, message: str, timeout: int = 0):
+        """Queue a status bar message, keeping only the newest until the next flush."""
+        self._status_pending = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    @pyqtSlot()
+    def _flush_status(self):
+        """Show the newest queued status bar message."""
+        if self._status_pending is not None:
+            self.status_bar.showMessage(*self._status_pending)
+            self._status_pending = None
+    
     def center_window(self):
         """Center the window on the screen."""
         screen = QApplication.primaryScreen().geometry()
@@ -156,9 +185,6 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Please login or register")
         # Hide user menu when showing auth view
         self.user_menu.setVisible(False)
-        # Disable user menu actions to prevent keyboard shortcuts when logged out
-        self.change_password_action.setEnabled(False)
-        self.logout_action.setEnabled(False)
         # Clear any stored state
         self.current_username = None
         self.current_entries = []
@@ -169,42 +195,55 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(f"Welcome, {self.current_username or 'User'}!")
         # Show user menu when showing dashboard view
         self.user_menu.setVisible(True)
-        # Enable user menu actions to allow keyboard shortcuts when logged in
-        self.change_password_action.setEnabled(True)
-        self.logout_action.setEnabled(True)
     
     # Signal handlers for auth widget
+    @pyqtSlot(str, str)
     def _on_login_requested(self, username: str, password: str):
         """Handle login request from auth widget."""
         if self.controller:
             self.controller.login_user(username, password)
     
+    @pyqtSlot(str, str, str)
     def _on_register_requested(self, username: str, password: str, confirm_password: str):
         """Handle registration request from auth widget."""
         if self.controller:
             self.controller.register_user(username, password, confirm_password)
     
     # Signal handlers for dashboard widget
+    @pyqtSlot()
     def _on_add_entry_requested(self):
         """Handle add entry request from dashboard."""
-        dialog = EntryDialog(self)
-        if dialog.exec() == EntryDialog.DialogCode.Accepted:
-            entry_data = dialog.get_entry_data()
-            if self.controller:
-                self.controller.add_entry(**entry_data)
+        dialog = self._get_entry_dialog()
+        accepted = dialog.exec() == EntryDialog.DialogCode.Accepted
+        entry_data = dialog.get_entry_data()
+        dialog.reset()
+        if accepted and self.controller:
+            self.controller.add_entry(**entry_data)
     
+    @pyqtSlot(int)
     def _on_edit_entry_requested(self, entry_id: int):
         """Handle edit entry request from dashboard."""
         if self.controller:
             entry = self.controller.get_entry_by_id(entry_id)
             if entry:
-                dialog = EntryDialog(self, entry)
-                if dialog.exec() == EntryDialog.DialogCode.Accepted:
-                    entry_data = dialog.get_entry_data()
+                dialog = self._get_entry_dialog(entry)
+                accepted = dialog.exec() == EntryDialog.DialogCode.Accepted
+                entry_data = dialog.get_entry_data()
+                dialog.reset()
+                if accepted:
                     self.controller.edit_entry(entry_id, **entry_data)
             else:
                 self._show_error_message("Entry not found", "The selected entry could not be found.")
     
+    def _get_entry_dialog(self, entry: dict | None = None) -> EntryDialog:
+        """Get the shared entry dialog, prepared for the given entry."""
+        if self._entry_dialog is None:
+            self._entry_dialog = EntryDialog(self, entry)
+        else:
+            self._entry_dialog.reset(entry)
+        return self._entry_dialog
+    
+    @pyqtSlot(int)
     def _on_delete_entry_requested(self, entry_id: int):
         """Handle delete entry request from dashboard."""
         reply = QMessageBox.question(
@@ -218,6 +257,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes and self.controller:
             self.controller.delete_entry(entry_id)
     
+    @pyqtSlot(int)
     def _on_view_entry_requested(self, entry_id: int):
         """Handle view entry request from dashboard."""
         if self.controller:
@@ -227,6 +267,7 @@ class MainWindow(QMainWindow):
             else:
                 self._show_error_message("Entry not found", "The selected entry could not be found.")
     
+    @pyqtSlot()
     def _on_logout_requested(self):
         """Handle logout request from menu."""
         # Additional security check - ensure user is logged in
@@ -237,6 +278,7 @@ class MainWindow(QMainWindow):
         if self.controller:
             self.controller.logout_user()
     
+    @pyqtSlot()
     def _on_change_password_requested(self):
         """Handle change password request from menu."""
         # Additional security check - ensure user is logged in
@@ -244,31 +286,50 @@ class MainWindow(QMainWindow):
             self._show_error_message("Authentication Required", "You must be logged in to change your password.")
             return
             
-        dialog = ChangePasswordDialog(self)
-        if dialog.exec() == ChangePasswordDialog.DialogCode.Accepted:
-            old_password, new_password, confirm_password = dialog.get_passwords()
-            if self.controller:
-                self.controller.change_master_password(old_password, new_password, confirm_password)
+        if self._change_password_dialog is None:
+            self._change_password_dialog = ChangePasswordDialog(self)
+        dialog = self._change_password_dialog
+        accepted = dialog.exec() == ChangePasswordDialog.DialogCode.Accepted
+        old_password, new_password, confirm_password = dialog.get_passwords()
+        dialog.clear_fields()
+        if accepted and self.controller:
+            self.controller.change_master_password(old_password, new_password, confirm_password)
     
+    @pyqtSlot()
     def _on_generate_password_requested(self):
         """Handle generate password request from dashboard."""
         self.show_password_generator()
     
+    @pyqtSlot()
     def show_password_generator(self):
         """Show the password generator dialog."""
-        dialog = PasswordGeneratorDialog(self)
-        dialog.exec()
+        if self._password_generator_dialog is None:
+            self._password_generator_dialog = PasswordGeneratorDialog(self)
+        else:
+            self._password_generator_dialog.reset()
+        self._password_generator_dialog.exec()
+    
+    @pyqtSlot()
+    def _warm_dialogs(self):
+        """Create any dialogs that have not been built yet."""
+        if self._entry_dialog is None:
+            self._entry_dialog = EntryDialog(self)
+        if self._password_generator_dialog is None:
+            self._password_generator_dialog = PasswordGeneratorDialog(self)
+        if self._change_password_dialog is None:
+            self._change_password_dialog = ChangePasswordDialog(self)
     
     def _show_entry_details(self, entry: dict):
         """Show entry details in a message box."""
-        details = f"""
-Entry Details:
-Name: {entry.get('Name', 'N/A')}
-Website/URL: {entry.get('Address', 'N/A')}
-Username: {entry.get('Username', 'N/A')}
-Password: {'*' * len(entry.get('Password', ''))}
-Notes: {entry.get('Notes', 'N/A')}
-        """.strip()
+        password = entry.get('Password') or ''
+        details = "\n".join((
+            "Entry Details:",
+            f"Name: {entry.get('Name', 'N/A')}",
+            f"Website/URL: {entry.get('Address', 'N/A')}",
+            f"Username: {entry.get('Username', 'N/A')}",
+            f"Password: {'*' * len(password) if password else 'N/A'}",
+            f"Notes: {entry.get('Notes', 'N/A')}",
+        ))
         
         QMessageBox.information(self, "Entry Details", details)
     
@@ -276,6 +337,7 @@ Notes: {entry.get('Notes', 'N/A')}
         """Show an error message to the user."""
         QMessageBox.critical(self, title, message)
     
+    @pyqtSlot()
     def show_about(self):
         """Show the about dialog."""
         about_text = """
@@ -301,14 +363,16 @@ Built with Python and PyQt6.
         self.current_username = username
         self.show_dashboard_view()
         self.auth_widget.clear_fields()
-        self.logger.info(f"User '{username}' logged in successfully")
+        # Build the dialogs once the dashboard has painted, so the first open is instant
+        QTimer.singleShot(0, self._warm_dialogs)
+        self.logger.info("User '%s' logged in successfully", username)
     
     @pyqtSlot(str)
     def on_login_failed(self, error_message: str):
         """Handle failed login."""
         self._show_error_message("Login Failed", error_message)
         self.auth_widget.set_login_focus()
-        self.logger.warning(f"Login failed: {error_message}")
+        self.logger.warning("Login failed: %s", error_message)
     
     @pyqtSlot()
     def on_logout_successful(self):
@@ -326,40 +390,45 @@ Built with Python and PyQt6.
             f"User '{username}' registered successfully. You can now login."
         )
         self.auth_widget.set_login_focus()
-        self.logger.info(f"User '{username}' registered successfully")
+        self.logger.info("User '%s' registered successfully", username)
     
     @pyqtSlot(str)
     def on_registration_failed(self, error_message: str):
         """Handle failed registration."""
         self._show_error_message("Registration Failed", error_message)
         self.auth_widget.set_register_focus()
-        self.logger.warning(f"Registration failed: {error_message}")
+        self.logger.warning("Registration failed: %s", error_message)
     
     @pyqtSlot(list)
     def on_entries_updated(self, entries: list[dict]):
         """Handle entries update."""
         self.current_entries = entries
-        self.dashboard_widget.update_entries(entries)
-        self.status_bar.showMessage(f"Loaded {len(entries)} entries")
-        self.logger.info(f"Updated {len(entries)} entries")
+        # Repaint the dashboard once after the table and count label are both updated
+        self.dashboard_widget.setUpdatesEnabled(False)
+        try:
+            self.dashboard_widget.update_entries(entries)
+        finally:
+            self.dashboard_widget.setUpdatesEnabled(True)
+        self._post_status(f"Loaded {len(entries)} entries")
+        self.logger.info("Updated %d entries", len(entries))
     
     @pyqtSlot(dict)
     def on_entry_added(self, entry: dict):
         """Handle entry added."""
-        self.status_bar.showMessage(f"Entry '{entry.get('Name', 'Unknown')}' added successfully", 3000)
-        self.logger.info(f"Entry '{entry.get('Name', 'Unknown')}' added")
+        self._post_status(f"Entry '{entry.get('Name', 'Unknown')}' added successfully", 3000)
+        self.logger.info("Entry '%s' added", entry.get('Name', 'Unknown'))
     
     @pyqtSlot(dict)
     def on_entry_updated(self, entry: dict):
         """Handle entry updated."""
-        self.status_bar.showMessage(f"Entry '{entry.get('Name', 'Unknown')}' updated successfully", 3000)
-        self.logger.info(f"Entry '{entry.get('Name', 'Unknown')}' updated")
+        self._post_status(f"Entry '{entry.get('Name', 'Unknown')}' updated successfully", 3000)
+        self.logger.info("Entry '%s' updated", entry.get('Name', 'Unknown'))
     
     @pyqtSlot(int)
     def on_entry_deleted(self, entry_id: int):
         """Handle entry deleted."""
-        self.status_bar.showMessage("Entry deleted successfully", 3000)
-        self.logger.info(f"Entry ID {entry_id} deleted")
+        self._post_status("Entry deleted successfully", 3000)
+        self.logger.info("Entry ID %s deleted", entry_id)
     
     @pyqtSlot(str)
     def on_password_generated(self, password: str):
@@ -374,7 +443,7 @@ Built with Python and PyQt6.
     def on_error_occurred(self, error_message: str):
         """Handle general error."""
         self._show_error_message("Error", error_message)
-        self.logger.error(f"Error occurred: {error_message}")
+        self.logger.error("Error occurred: %s", error_message)
     
     @pyqtSlot()
     def on_master_password_changed(self):
@@ -4,9 +4,9 @@ Password generator dialog for creating secure random passwords.
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit,
-    QPushButton, QCheckBox, QGroupBox, QSpinBox, QSlider, QMessageBox
+    QPushButton, QCheckBox, QGroupBox, QSpinBox, QSlider, QMessageBox, QButtonGroup
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSlot
 from PyQt6.QtWidgets import QApplication
 
 from password_manager.controllers.password_controller import PasswordController
@@ -14,19 +14,79 @@ from password_manager.controllers.password_controller import PasswordController
 class PasswordGeneratorDialog(QDialog):
     """Dialog for generating secure random passwords."""
     
+    # Delay before a burst of option changes regenerates the preview
+    _PREVIEW_DEBOUNCE_MS = 75
+    
+    # Widget styles matched by object name, applied once on the dialog
+    _DIALOG_STYLE = """
+        QLineEdit#passwordDisplay {
+            background-color: #f0f0f0;
+            color: #000;
+            border: 2px solid #ccc;
+            border-radius: 5px;
+            padding: 8px;
+            font-family: 'Courier New', monospace;
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QPushButton#generateButton {
+            background-color: #107c10;
+            color: white;
+            border: none;
+            border-radius: 3px;
+            padding: 5px 10px;
+            font-weight: bold;
+        }
+        QPushButton#generateButton:hover {
+            background-color: #0e6e0e;
+        }
+        QPushButton#copyButton {
+            background-color: #0078d4;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 8px 16px;
+        }
+        QPushButton#copyButton:hover {
+            background-color: #106ebe;
+        }
+        QPushButton#closeButton {
+            background-color: #666;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 8px 16px;
+        }
+        QPushButton#closeButton:hover {
+            background-color: #555;
+        }
+    """
+    
     def __init__(self, parent=None):
         """Initialize the password generator dialog."""
         super().__init__(parent)
-        self.password_controller = PasswordController()
+        self.password_controller = PasswordController.shared()
+        
+        # Coalesce slider drags and option toggles into a single regeneration
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self._PREVIEW_DEBOUNCE_MS)
+        
+        # Whether the password field holds a generated password rather than an error message
+        self._password_valid = False
+        # Set while the dialog is hidden; the password is generated when it is next shown
+        self._preview_pending = True
+        
         self.setup_ui()
+        self._last_length = self.length_spinbox.value()
         self._connect_signals()
-        self._update_password_preview()
     
     def setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("Password Generator")
         self.setMinimumSize(450, 350)
         self.setModal(True)
+        self.setStyleSheet(self._DIALOG_STYLE)
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -51,20 +111,9 @@ class PasswordGeneratorDialog(QDialog):
         
         # Password field
         self.password_edit = QLineEdit()
+        self.password_edit.setObjectName("passwordDisplay")
         self.password_edit.setReadOnly(True)
         self.password_edit.setMinimumHeight(40)
-        self.password_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #f0f0f0;
-                color: #000;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                padding: 8px;
-                font-family: 'Courier New', monospace;
-                font-size: 14px;
-                font-weight: bold;
-            }
-        """)
         display_layout.addWidget(self.password_edit)
         
         # Generate button
@@ -72,20 +121,8 @@ class PasswordGeneratorDialog(QDialog):
         copy_layout.addStretch()
         
         self.generate_button = QPushButton("Generate New Password")
+        self.generate_button.setObjectName("generateButton")
         self.generate_button.setMinimumHeight(30)
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                background-color: #107c10;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0e6e0e;
-            }
-        """)
         copy_layout.addWidget(self.generate_button)
         
         display_layout.addLayout(copy_layout)
@@ -156,6 +193,14 @@ class PasswordGeneratorDialog(QDialog):
         self.exclude_ambiguous_checkbox = QCheckBox("Exclude ambiguous characters ({}, [], (), /, \\, |, `, ~)")
         chars_layout.addWidget(self.exclude_ambiguous_checkbox)
         
+        # Non-exclusive group so every option change arrives through one signal
+        self._options_group = QButtonGroup(self)
+        self._options_group.setExclusive(False)
+        for checkbox in (self.uppercase_checkbox, self.lowercase_checkbox, self.digits_checkbox,
+                         self.special_checkbox, self.exclude_similar_checkbox,
+                         self.exclude_ambiguous_checkbox):
+            self._options_group.addButton(checkbox)
+        
         parent_layout.addWidget(chars_group)
     
     def _create_buttons(self, parent_layout):
@@ -165,36 +210,14 @@ class PasswordGeneratorDialog(QDialog):
         
         # Copy button
         self.copy_button = QPushButton("Copy to Clipboard")
+        self.copy_button.setObjectName("copyButton")
         self.copy_button.setMinimumHeight(35)
-        self.copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
         button_layout.addWidget(self.copy_button)
         
         # Close button
         self.close_button = QPushButton("Close")
+        self.close_button.setObjectName("closeButton")
         self.close_button.setMinimumHeight(35)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #666;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-        """)
         button_layout.addWidget(self.close_button)
         
         parent_layout.addLayout(button_layout)
@@ -206,29 +229,38 @@ class PasswordGeneratorDialog(QDialog):
         self.copy_button.clicked.connect(self._on_copy_clicked)
         self.close_button.clicked.connect(self.accept)
         
+        self._preview_timer.timeout.connect(self._update_password_preview)
+        
         # Length controls
         self.length_slider.valueChanged.connect(self._on_length_changed)
         self.length_spinbox.valueChanged.connect(self._on_length_changed)
         
         # Character option changes
-        self.uppercase_checkbox.toggled.connect(self._on_options_changed)
-        self.lowercase_checkbox.toggled.connect(self._on_options_changed)
-        self.digits_checkbox.toggled.connect(self._on_options_changed)
-        self.special_checkbox.toggled.connect(self._on_options_changed)
+        self._options_group.buttonToggled.connect(self._on_options_changed)
     
-    def _on_length_changed(self, value):
+    @pyqtSlot(int)
+    def _on_length_changed(self, value: int):
         """Handle length value changes."""
-        self.length_slider.setValue(value)
-        self.length_spinbox.setValue(value)
+        if value == self._last_length:
+            return
+        self._last_length = value
+        # Sync the peer control without it re-emitting valueChanged back here
+        with QSignalBlocker(self.length_slider), QSignalBlocker(self.length_spinbox):
+            self.length_slider.setValue(value)
+            self.length_spinbox.setValue(value)
         self.length_value_label.setText(f"{value} characters")
-        self._update_password_preview()
+        self._preview_timer.start()
     
+    @pyqtSlot()
     def _on_options_changed(self):
         """Handle character option changes."""
-        self._update_password_preview()
+        self._preview_timer.start()
     
+    @pyqtSlot()
     def _update_password_preview(self):
         """Update the password preview."""
+        # Any pending debounced regeneration is superseded by this one
+        self._preview_timer.stop()
         # Check if at least one character type is selected
         if not any([
             self.uppercase_checkbox.isChecked(),
@@ -236,6 +268,7 @@ class PasswordGeneratorDialog(QDialog):
             self.digits_checkbox.isChecked(),
             self.special_checkbox.isChecked()
         ]):
+            self._password_valid = False
             self.password_edit.setText("Please select at least one character type")
             return
         
@@ -250,24 +283,38 @@ class PasswordGeneratorDialog(QDialog):
             exclude_ambiguous=self.exclude_ambiguous_checkbox.isChecked()
         )
         
+        self._password_valid = bool(preview_password)
         if preview_password:
             self.password_edit.setText(preview_password)
         else:
             self.password_edit.setText("No valid characters selected")
     
+    @pyqtSlot()
     def _on_generate_clicked(self):
         """Handle generate button click."""
         self._update_password_preview()
     
+    @pyqtSlot()
     def _on_copy_clicked(self):
         """Handle copy button click."""
-        password = self.password_edit.text()
-        if password and password != "Please select at least one character type" and password != "No valid characters selected":
-            clipboard = QApplication.clipboard()
-            clipboard.setText(password)
-            QMessageBox.information(self, "Copied", "Password copied to clipboard!")
-        else:
+        if not self._password_valid:
             QMessageBox.warning(self, "Copy Error", "No valid password to copy.")
+            return
+        
+        clipboard = QApplication.clipboard()
+        clipboard.setText(self.password_edit.text())
+        QMessageBox.information(self, "Copied", "Password copied to clipboard!")
+    
+    def showEvent(self, event):
+        """Generate the password on show rather than when the dialog is built or reset."""
+        super().showEvent(event)
+        if self._preview_pending:
+            self._preview_pending = False
+            self._update_password_preview()
+    
+    def reset(self):
+        """Prepare the dialog to be shown again with a freshly generated password."""
+        self._preview_pending = True
     
     def get_generator_params(self) -> dict:
         """Get the current generator parameters.
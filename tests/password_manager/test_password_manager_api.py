@@ -1,35 +1,111 @@
 import pytest
 import json
-from pytest_mock import mocker
+from unittest.mock import MagicMock, create_autospec
+from password_manager import password_manager_api
 from password_manager.password_manager_api import PasswordManagerAPI
+from password_manager.utils.database_manager import DatabaseManager
+from password_manager.utils.encryption_handler import EncryptionHandler
+
+# Decrypted entry payloads, serialized once at import rather than in each test
+_ENTRY_JSON = {
+    i: json.dumps({"Name": f"Entry {i}", "Address": f"{chr(96 + i)}.com",
+                   "Username": f"u{i}", "Password": f"p{i}", "Notes": ""})
+    for i in (1, 2)
+}
+
+# Fixture to provide one mocked PasswordManagerAPI instance for the whole module
+@pytest.fixture(scope="module")
+def api_instance():
+    """
+    Provides a PasswordManagerAPI instance with mocked dependencies.
+    The patches and the instance are created once; _reset_api_mocks restores a clean state before each test.
+    """
+    # The monkeypatch fixture is function-scoped, so use its context manager; patches are undone on exit.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Patch the static utility classes where they are imported within the password_manager_api module.
+        # This ensures that when PasswordManagerAPI uses these, it uses the mocks.
+        mock_verification_utils = MagicMock()
+        mock_password_generator = MagicMock()
+        monkeypatch.setattr(password_manager_api, 'VerificationUtils', mock_verification_utils)
+        monkeypatch.setattr(password_manager_api, 'PasswordGenerator', mock_password_generator)
+
+        # Create the instance without running __init__, so no DatabaseManager or EncryptionHandler
+        # is ever constructed, and set the attributes __init__ would have set.
+        api = object.__new__(PasswordManagerAPI)
+
+        # The instance dependencies are autospecced mocks: only the real methods exist,
+        # calls are checked against their signatures, and no other attribute can be set.
+        # For static methods like VerificationUtils and PasswordGenerator, the mock class itself is used.
+        api.db_manager = create_autospec(DatabaseManager, instance=True, spec_set=True)
+        api.encryption_handler = create_autospec(EncryptionHandler, instance=True, spec_set=True)
+        api.verification_utils = mock_verification_utils
+        api.password_generator = mock_password_generator
+        api.current_user_id = None
+        api.current_master_key = None
+        api.current_username = None
+
+        yield api
+
+
+@pytest.fixture(autouse=True)
+def _reset_api_mocks(api_instance):
+    """
+    Clears recorded calls, return values and side effects from the shared mocks,
+    and logs the shared API instance out before each test.
+    """
+    for mock in (api_instance.db_manager, api_instance.encryption_handler,
+                 api_instance.verification_utils, api_instance.password_generator):
+        mock.reset_mock(return_value=True, side_effect=True)
+    api_instance.current_user_id = None
+    api_instance.current_master_key = None
+    api_instance.current_username = None
+
+
+# VerificationUtils check run on each entry field by add_entry and edit_entry
+_ENTRY_VALIDATORS = {
+    "name": "is_valid_entry_name",
+    "address": "is_valid_address",
+    "username": "is_valid_entry_username_field",
+    "password": "is_valid_entry_password_field",
+    "notes": "is_valid_entry_notes",
+}
+
+# Entry validation cases: no field broken, then each field broken on its own
+_VALIDATION_CASES = [
+    pytest.param(None, True, id="all_ok"),
+    *(pytest.param(field, False, id=f"bad_{field}") for field in _ENTRY_VALIDATORS),
+]
 
-# Fixture to provide a mocked PasswordManagerAPI instance for each test
 @pytest.fixture
-def api_instance(mocker): # Accept the mocker fixture
+def all_validations_pass(api_instance):
     """
-    Provides a PasswordManagerAPI instance with mocked dependencies using pytest-mock.
+    Makes every entry field validation succeed on the shared API instance.
     """
-    # Patch the classes where they are imported within the password_manager_api module.
-    # This ensures that when PasswordManagerAPI uses these, it uses the mocks.
-    MockDBManager = mocker.patch('password_manager.password_manager_api.DatabaseManager')
-    MockEncryptionHandler = mocker.patch('password_manager.password_manager_api.EncryptionHandler')
-    # IMPORTANT: Patch VerificationUtils where it's imported in password_manager_api.py
-    MockVerificationUtils = mocker.patch('password_manager.password_manager_api.VerificationUtils')
-    MockPasswordGenerator = mocker.patch('password_manager.password_manager_api.PasswordGenerator')
+    for name in _ENTRY_VALIDATORS.values():
+        getattr(api_instance.verification_utils, name).return_value = (True, "")
+    return api_instance
+
 
-    # Create an instance of the API. It will now use the patched (mocked) classes.
-    api = PasswordManagerAPI(db_file=':memory:')
+@pytest.fixture
+def logged_in_api(api_instance):
+    """
+    Provides the shared API instance with user 1 logged in.
+    """
+    api_instance.current_user_id = 1
+    api_instance.current_master_key = b"master_key"
+    api_instance.current_username = "testuser"
+    return api_instance
 
-    # Assign the return_value of the class mocks to the API instance's attributes
-    # This is correct because MockDBManager and MockEncryptionHandler are mocks of classes,
-    # and their instances (what PasswordManagerAPI's __init__ creates) are accessed via .return_value.
-    # For static methods like VerificationUtils and PasswordGenerator, the mock class itself is used.
-    api.db_manager = MockDBManager.return_value
-    api.encryption_handler = MockEncryptionHandler.return_value
-    api.verification_utils = MockVerificationUtils
-    api.password_generator = MockPasswordGenerator
 
-    yield api
+@pytest.fixture(scope="module")
+def two_encrypted_entries():
+    """
+    Provides two (entry_id, user_id, entry_name, encrypted_data) rows as returned by get_entries_by_user_id.
+    """
+    return [
+        (101, 1, "Entry 1", b"encrypted_data_1"),
+        (102, 1, "Entry 2", b"encrypted_data_2"),
+    ]
 
 
 class TestUserManagement:
@@ -41,17 +117,21 @@ class TestUserManagement:
         """
         Test successful user registration.
         """
-        # Set return values directly on the mocked static methods
-        api_instance.verification_utils.is_valid_username.return_value = (True, "")
-        api_instance.db_manager.get_user_by_username.return_value = None # User does not exist
-        api_instance.encryption_handler.generate_salt.return_value = b"test_salt"
-        api_instance.encryption_handler.derive_key.return_value = b"derived_key_hash"
-        api_instance.db_manager.add_user.return_value = 1 # User ID
+        # Set return values on each mock in a single configure_mock call
+        api_instance.verification_utils.configure_mock(**{'is_valid_username.return_value': (True, "")})
+        api_instance.encryption_handler.configure_mock(**{
+            'generate_salt.return_value': b"test_salt",
+            'derive_key.return_value': b"derived_key_hash",
+        })
+        api_instance.db_manager.configure_mock(**{
+            'get_user_by_username.return_value': None, # User does not exist
+            'add_user.return_value': 1, # User ID
+        })
 
         success, message = api_instance.register_user("newuser", "MasterPass123!")
 
         assert success is True
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.verification_utils.is_valid_username.assert_called_once_with("newuser")
         api_instance.db_manager.get_user_by_username.assert_called_once_with("newuser")
         api_instance.encryption_handler.generate_salt.assert_called_once()
@@ -83,7 +163,7 @@ class TestUserManagement:
         success, message = api_instance.register_user("existinguser", "MasterPass123!")
 
         assert success is False
-        assert message != "" # Check that a message is returned for existing user
+        assert message # Check that a message is returned for existing user
         api_instance.db_manager.get_user_by_username.assert_called_once_with("existinguser")
         api_instance.encryption_handler.generate_salt.assert_not_called()
 
@@ -91,11 +171,15 @@ class TestUserManagement:
         """
         Test user registration when adding to the database fails.
         """
-        api_instance.verification_utils.is_valid_username.return_value = (True, "")
-        api_instance.db_manager.get_user_by_username.return_value = None
-        api_instance.encryption_handler.generate_salt.return_value = b"test_salt"
-        api_instance.encryption_handler.derive_key.return_value = b"derived_key_hash"
-        api_instance.db_manager.add_user.return_value = None # Simulate DB failure
+        api_instance.verification_utils.configure_mock(**{'is_valid_username.return_value': (True, "")})
+        api_instance.encryption_handler.configure_mock(**{
+            'generate_salt.return_value': b"test_salt",
+            'derive_key.return_value': b"derived_key_hash",
+        })
+        api_instance.db_manager.configure_mock(**{
+            'get_user_by_username.return_value': None,
+            'add_user.return_value': None, # Simulate DB failure
+        })
 
         success, message = api_instance.register_user("dbfailuser", "MasterPass123!")
 
@@ -119,7 +203,7 @@ class TestUserManagement:
         success, message = api_instance.login_user(username, master_password)
 
         assert success is True
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         assert api_instance.current_user_id == 1
         assert api_instance.current_username == username
         assert api_instance.current_master_key == b"derived_key_hash"
@@ -172,25 +256,23 @@ class TestUserManagement:
         success, message = api_instance.logout_user()
 
         assert success is True
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         assert api_instance.current_user_id is None
         assert api_instance.current_master_key is None
         assert api_instance.current_username is None
 
-    def test_is_logged_in(self, api_instance):
+    @pytest.mark.parametrize("user_id, master_key, expected", [
+        (1, b"some_key", True),
+        (None, b"some_key", False), # No user id
+        (1, None, False), # No master key
+    ])
+    def test_is_logged_in(self, api_instance, user_id, master_key, expected):
         """
         Test is_logged_in method.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"some_key"
-        assert api_instance.is_logged_in() is True
-
-        api_instance.current_user_id = None
-        assert api_instance.is_logged_in() is False
-
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = None
-        assert api_instance.is_logged_in() is False
+        api_instance.current_user_id = user_id
+        api_instance.current_master_key = master_key
+        assert api_instance.is_logged_in() is expected
 
 
 class TestEntryManagement:
@@ -198,36 +280,22 @@ class TestEntryManagement:
     Test suite for adding, viewing, editing, and removing password entries in PasswordManagerAPI.
     """
 
-    @pytest.mark.parametrize("valid_name, valid_address, valid_username, valid_password, valid_notes, expected_success", [
-        (True, True, True, True, True, True),  # All valid
-        (False, True, True, True, True, False), # Invalid name
-        (True, False, True, True, True, False), # Invalid address
-        (True, True, False, True, True, False), # Invalid username field
-        (True, True, True, False, True, False), # Invalid password field
-        (True, True, True, True, False, False), # Invalid notes
-    ])
-    def test_add_entry_validation(self, api_instance, valid_name, valid_address, valid_username, valid_password, valid_notes, expected_success):
+    @pytest.mark.parametrize("bad_field, expected_success", _VALIDATION_CASES)
+    def test_add_entry_validation(self, logged_in_api, all_validations_pass, bad_field, expected_success):
         """
         Test add_entry with various validation scenarios.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
+        if bad_field:
+            getattr(logged_in_api.verification_utils, _ENTRY_VALIDATORS[bad_field]).return_value = (False, f"Invalid {bad_field}")
 
-        # Set return values for all validation static methods
-        api_instance.verification_utils.is_valid_entry_name.return_value = (valid_name, "Invalid name" if not valid_name else "")
-        api_instance.verification_utils.is_valid_address.return_value = (valid_address, "Invalid address" if not valid_address else "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (valid_username, "Invalid entry username" if not valid_username else "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (valid_password, "Invalid entry password" if not valid_password else "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (valid_notes, "Invalid notes" if not valid_notes else "")
-
-        success, message = api_instance.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
+        success, message = logged_in_api.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
 
         assert success is expected_success
         if not expected_success:
             assert "Invalid" in message # Check for any validation error message
         else:
-            api_instance.encryption_handler.encrypt_data.assert_called_once()
-            api_instance.db_manager.add_entry.assert_called_once()
+            logged_in_api.encryption_handler.encrypt_data.assert_called_once()
+            logged_in_api.db_manager.add_entry.assert_called_once()
 
     def test_add_entry_not_logged_in(self, api_instance):
         """
@@ -236,71 +304,48 @@ class TestEntryManagement:
         api_instance.current_user_id = None # Ensure not logged in
         success, message = api_instance.add_entry("Name", "Addr", "User", "Pass", "Notes")
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.encryption_handler.encrypt_data.assert_not_called()
         api_instance.db_manager.add_entry.assert_not_called()
 
-    def test_add_entry_encryption_failure(self, api_instance):
+    def test_add_entry_encryption_failure(self, logged_in_api, all_validations_pass):
         """
         Test add_entry when encryption fails.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.verification_utils.is_valid_entry_name.return_value = (True, "")
-        api_instance.verification_utils.is_valid_address.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (True, "")
-        api_instance.encryption_handler.encrypt_data.side_effect = Exception("Encryption error")
+        logged_in_api.encryption_handler.encrypt_data.side_effect = Exception("Encryption error")
 
-        success, message = api_instance.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
+        success, message = logged_in_api.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
 
         assert success is False
         assert "failed" in message # Check for generic failed message
-        api_instance.encryption_handler.encrypt_data.assert_called_once()
-        api_instance.db_manager.add_entry.assert_not_called()
+        logged_in_api.encryption_handler.encrypt_data.assert_called_once()
+        logged_in_api.db_manager.add_entry.assert_not_called()
 
-    def test_add_entry_db_failure(self, api_instance):
+    def test_add_entry_db_failure(self, logged_in_api, all_validations_pass):
         """
         Test add_entry when database addition fails.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.verification_utils.is_valid_entry_name.return_value = (True, "")
-        api_instance.verification_utils.is_valid_address.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (True, "")
-        api_instance.encryption_handler.encrypt_data.return_value = b"encrypted_data"
-        api_instance.db_manager.add_entry.return_value = None # Simulate DB failure
+        logged_in_api.encryption_handler.encrypt_data.return_value = b"encrypted_data"
+        logged_in_api.db_manager.add_entry.return_value = None # Simulate DB failure
 
-        success, message = api_instance.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
+        success, message = logged_in_api.add_entry("Test Name", "test.com", "testuser", "pass", "notes")
 
         assert success is False
         assert "Failed" in message # Check for generic failed message
-        api_instance.db_manager.add_entry.assert_called_once()
+        logged_in_api.db_manager.add_entry.assert_called_once()
 
-    def test_view_entries_success(self, api_instance):
+    def test_view_entries_success(self, logged_in_api, two_encrypted_entries):
         """
         Test successful retrieval and decryption of entries.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        encrypted_data_1 = b"encrypted_data_1"
-        encrypted_data_2 = b"encrypted_data_2"
-        decrypted_json_1 = json.dumps({"Name": "Entry 1", "Address": "a.com", "Username": "u1", "Password": "p1", "Notes": ""})
-        decrypted_json_2 = json.dumps({"Name": "Entry 2", "Address": "b.com", "Username": "u2", "Password": "p2", "Notes": ""})
-
-        api_instance.db_manager.get_entries_by_user_id.return_value = [
-            (101, 1, "Entry 1", encrypted_data_1),
-            (102, 1, "Entry 2", encrypted_data_2)
-        ]
-        api_instance.encryption_handler.decrypt_data.side_effect = [
-            decrypted_json_1,
-            decrypted_json_2
+
+        logged_in_api.db_manager.get_entries_by_user_id.return_value = two_encrypted_entries
+        logged_in_api.encryption_handler.decrypt_data.side_effect = [
+            _ENTRY_JSON[1],
+            _ENTRY_JSON[2]
         ]
 
-        success, entries = api_instance.view_entries()
+        success, entries = logged_in_api.view_entries()
 
         assert success is True
         assert len(entries) == 2
@@ -310,24 +355,22 @@ class TestEntryManagement:
         assert entries[1]['id'] == 102
         assert entries[1]['EntryName'] == "Entry 2"
         assert entries[1]['Username'] == "u2"
-        api_instance.db_manager.get_entries_by_user_id.assert_called_once_with(1)
-        api_instance.encryption_handler.decrypt_data.assert_any_call(b"master_key", encrypted_data_1)
-        api_instance.encryption_handler.decrypt_data.assert_any_call(b"master_key", encrypted_data_2)
+        logged_in_api.db_manager.get_entries_by_user_id.assert_called_once_with(1)
+        logged_in_api.encryption_handler.decrypt_data.assert_any_call(b"master_key", two_encrypted_entries[0][3])
+        logged_in_api.encryption_handler.decrypt_data.assert_any_call(b"master_key", two_encrypted_entries[1][3])
 
-    def test_view_entries_no_entries(self, api_instance):
+    def test_view_entries_no_entries(self, logged_in_api):
         """
         Test view_entries when there are no entries for the user.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.db_manager.get_entries_by_user_id.return_value = []
+        logged_in_api.db_manager.get_entries_by_user_id.return_value = []
 
-        success, entries = api_instance.view_entries()
+        success, entries = logged_in_api.view_entries()
 
         assert success is True
         assert entries == []
-        api_instance.db_manager.get_entries_by_user_id.assert_called_once_with(1)
-        api_instance.encryption_handler.decrypt_data.assert_not_called()
+        logged_in_api.db_manager.get_entries_by_user_id.assert_called_once_with(1)
+        logged_in_api.encryption_handler.decrypt_data.assert_not_called()
 
     def test_view_entries_not_logged_in(self, api_instance):
         """
@@ -336,57 +379,46 @@ class TestEntryManagement:
         api_instance.current_user_id = None
         success, message = api_instance.view_entries()
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.db_manager.get_entries_by_user_id.assert_not_called()
 
-    def test_view_entries_decryption_failure_skips_entry(self, api_instance):
+    def test_view_entries_decryption_failure_skips_entry(self, logged_in_api, two_encrypted_entries):
         """
         Test view_entries handles decryption failures gracefully by skipping the entry.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        encrypted_data_good = b"encrypted_data_good"
-        encrypted_data_bad = b"encrypted_data_bad"
-        decrypted_json_good = json.dumps({"Name": "Good Entry", "Address": "g.com", "Username": "gu", "Password": "gp", "Notes": ""})
-
-        api_instance.db_manager.get_entries_by_user_id.return_value = [
-            (101, 1, "Good Entry", encrypted_data_good),
-            (102, 1, "Bad Entry", encrypted_data_bad) # This one will fail decryption
-        ]
-        api_instance.encryption_handler.decrypt_data.side_effect = [
-            decrypted_json_good,
-            None # Simulate decryption failure
+
+        logged_in_api.db_manager.get_entries_by_user_id.return_value = two_encrypted_entries
+        logged_in_api.encryption_handler.decrypt_data.side_effect = [
+            _ENTRY_JSON[1],
+            None # Simulate decryption failure of the second entry
         ]
 
-        success, entries = api_instance.view_entries()
+        success, entries = logged_in_api.view_entries()
 
         assert success is True
         assert len(entries) == 1 # Only the good entry should be returned
         assert entries[0]['id'] == 101
-        assert entries[0]['EntryName'] == "Good Entry"
-        assert api_instance.encryption_handler.decrypt_data.call_count == 2 # Both attempts should be made
+        assert entries[0]['EntryName'] == "Entry 1"
+        assert logged_in_api.encryption_handler.decrypt_data.call_count == 2 # Both attempts should be made
 
-    def test_get_entry_by_id_success(self, api_instance):
+    def test_get_entry_by_id_success(self, logged_in_api):
         """
         Test successful retrieval and decryption of a single entry by ID.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
         entry_id = 101
         encrypted_data = b"encrypted_single_data"
-        decrypted_json = json.dumps({"Name": "Single Entry", "Address": "s.com", "Username": "su", "Password": "sp", "Notes": ""})
 
-        api_instance.db_manager.get_entry_by_id.return_value = (entry_id, 1, "Single Entry", encrypted_data)
-        api_instance.encryption_handler.decrypt_data.return_value = decrypted_json
+        logged_in_api.db_manager.get_entry_by_id.return_value = (entry_id, 1, "Single Entry", encrypted_data)
+        logged_in_api.encryption_handler.decrypt_data.return_value = _ENTRY_JSON[1]
 
-        success, entry = api_instance.get_entry_by_id(entry_id)
+        success, entry = logged_in_api.get_entry_by_id(entry_id)
 
         assert success is True
         assert entry['id'] == entry_id
         assert entry['EntryName'] == "Single Entry"
-        assert entry['Username'] == "su"
-        api_instance.db_manager.get_entry_by_id.assert_called_once_with(entry_id, 1)
-        api_instance.encryption_handler.decrypt_data.assert_called_once_with(b"master_key", encrypted_data)
+        assert entry['Username'] == "u1"
+        logged_in_api.db_manager.get_entry_by_id.assert_called_once_with(entry_id, 1)
+        logged_in_api.encryption_handler.decrypt_data.assert_called_once_with(b"master_key", encrypted_data)
 
     def test_get_entry_by_id_not_logged_in(self, api_instance):
         """
@@ -395,68 +427,55 @@ class TestEntryManagement:
         api_instance.current_user_id = None
         success, message = api_instance.get_entry_by_id(1)
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.db_manager.get_entry_by_id.assert_not_called()
 
-    def test_get_entry_by_id_not_found(self, api_instance):
+    def test_get_entry_by_id_not_found(self, logged_in_api):
         """
         Test get_entry_by_id when the entry is not found.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.db_manager.get_entry_by_id.return_value = None
+        logged_in_api.db_manager.get_entry_by_id.return_value = None
 
-        success, message = api_instance.get_entry_by_id(999)
+        success, message = logged_in_api.get_entry_by_id(999)
 
         assert success is False
-        assert message != "" # Check that a message is returned
-        api_instance.db_manager.get_entry_by_id.assert_called_once_with(999, 1)
-        api_instance.encryption_handler.decrypt_data.assert_not_called()
+        assert message # Check that a message is returned
+        logged_in_api.db_manager.get_entry_by_id.assert_called_once_with(999, 1)
+        logged_in_api.encryption_handler.decrypt_data.assert_not_called()
 
-    def test_get_entry_by_id_decryption_failure(self, api_instance):
+    def test_get_entry_by_id_decryption_failure(self, logged_in_api):
         """
         Test get_entry_by_id when decryption fails.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
         entry_id = 101
         encrypted_data = b"corrupt_encrypted_data"
 
-        api_instance.db_manager.get_entry_by_id.return_value = (entry_id, 1, "Corrupt Entry", encrypted_data)
-        api_instance.encryption_handler.decrypt_data.return_value = None # Simulate decryption failure
+        logged_in_api.db_manager.get_entry_by_id.return_value = (entry_id, 1, "Corrupt Entry", encrypted_data)
+        logged_in_api.encryption_handler.decrypt_data.return_value = None # Simulate decryption failure
 
-        success, message = api_instance.get_entry_by_id(entry_id)
+        success, message = logged_in_api.get_entry_by_id(entry_id)
 
         assert success is False
         assert "Failed" in message # Check for generic failed message
-        api_instance.encryption_handler.decrypt_data.assert_called_once_with(b"master_key", encrypted_data)
+        logged_in_api.encryption_handler.decrypt_data.assert_called_once_with(b"master_key", encrypted_data)
 
-    @pytest.mark.parametrize("valid_name, valid_address, valid_username, valid_password, valid_notes, expected_success", [
-        (True, True, True, True, True, True),  # All valid
-        (False, True, True, True, True, False), # Invalid name
-    ])
-    def test_edit_entry_validation(self, api_instance, valid_name, valid_address, valid_username, valid_password, valid_notes, expected_success):
+    @pytest.mark.parametrize("bad_field, expected_success", _VALIDATION_CASES)
+    def test_edit_entry_validation(self, logged_in_api, all_validations_pass, bad_field, expected_success):
         """
         Test edit_entry with various validation scenarios.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.db_manager.update_entry.return_value = True # Assume DB update would succeed if reached
+        logged_in_api.db_manager.update_entry.return_value = True # Assume DB update would succeed if reached
+        if bad_field:
+            getattr(logged_in_api.verification_utils, _ENTRY_VALIDATORS[bad_field]).return_value = (False, f"Invalid {bad_field}")
 
-        api_instance.verification_utils.is_valid_entry_name.return_value = (valid_name, "Invalid name" if not valid_name else "")
-        api_instance.verification_utils.is_valid_address.return_value = (valid_address, "Invalid address" if not valid_address else "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (valid_username, "Invalid entry username" if not valid_username else "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (valid_password, "Invalid entry password" if not valid_password else "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (valid_notes, "Invalid notes" if not valid_notes else "")
-
-        success, message = api_instance.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
+        success, message = logged_in_api.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
 
         assert success is expected_success
         if not expected_success:
             assert "Invalid" in message
         else:
-            api_instance.encryption_handler.encrypt_data.assert_called_once()
-            api_instance.db_manager.update_entry.assert_called_once()
+            logged_in_api.encryption_handler.encrypt_data.assert_called_once()
+            logged_in_api.db_manager.update_entry.assert_called_once()
 
     def test_edit_entry_not_logged_in(self, api_instance):
         """
@@ -465,63 +484,47 @@ class TestEntryManagement:
         api_instance.current_user_id = None
         success, message = api_instance.edit_entry(1, "N", "A", "U", "P", "N")
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.encryption_handler.encrypt_data.assert_not_called()
         api_instance.db_manager.update_entry.assert_not_called()
 
-    def test_edit_entry_encryption_failure(self, api_instance):
+    def test_edit_entry_encryption_failure(self, logged_in_api, all_validations_pass):
         """
         Test edit_entry when encryption fails during update.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.verification_utils.is_valid_entry_name.return_value = (True, "")
-        api_instance.verification_utils.is_valid_address.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (True, "")
-        api_instance.encryption_handler.encrypt_data.side_effect = Exception("Encryption error")
+        logged_in_api.encryption_handler.encrypt_data.side_effect = Exception("Encryption error")
 
-        success, message = api_instance.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
+        success, message = logged_in_api.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
 
         assert success is False
         assert "failed" in message # Check for generic failed message
-        api_instance.encryption_handler.encrypt_data.assert_called_once()
-        api_instance.db_manager.update_entry.assert_not_called()
+        logged_in_api.encryption_handler.encrypt_data.assert_called_once()
+        logged_in_api.db_manager.update_entry.assert_not_called()
 
-    def test_edit_entry_db_update_failure(self, api_instance):
+    def test_edit_entry_db_update_failure(self, logged_in_api, all_validations_pass):
         """
         Test edit_entry when database update fails.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"master_key"
-        api_instance.verification_utils.is_valid_entry_name.return_value = (True, "")
-        api_instance.verification_utils.is_valid_address.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_username_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_password_field.return_value = (True, "")
-        api_instance.verification_utils.is_valid_entry_notes.return_value = (True, "")
-        api_instance.encryption_handler.encrypt_data.return_value = b"new_encrypted_data"
-        api_instance.db_manager.update_entry.return_value = False # Simulate DB update failure
+        logged_in_api.encryption_handler.encrypt_data.return_value = b"new_encrypted_data"
+        logged_in_api.db_manager.update_entry.return_value = False # Simulate DB update failure
 
-        success, message = api_instance.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
+        success, message = logged_in_api.edit_entry(101, "New Name", "new.com", "newuser", "newpass", "newnotes")
 
         assert success is False
         assert "Failed" in message # Check for generic failed message
-        api_instance.db_manager.update_entry.assert_called_once()
+        logged_in_api.db_manager.update_entry.assert_called_once()
 
-    def test_remove_entry_success(self, api_instance):
+    def test_remove_entry_success(self, logged_in_api):
         """
         Test successful removal of an entry.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"some_master_key"
-        api_instance.db_manager.delete_entry.return_value = True
+        logged_in_api.db_manager.delete_entry.return_value = True
 
-        success, message = api_instance.remove_entry(101)
+        success, message = logged_in_api.remove_entry(101)
 
         assert success is True
-        assert message != "" # Check that a message is returned
-        api_instance.db_manager.delete_entry.assert_called_once_with(101, 1)
+        assert message # Check that a message is returned
+        logged_in_api.db_manager.delete_entry.assert_called_once_with(101, 1)
 
     def test_remove_entry_not_logged_in(self, api_instance):
         """
@@ -530,22 +533,20 @@ class TestEntryManagement:
         api_instance.current_user_id = None
         success, message = api_instance.remove_entry(1)
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.db_manager.delete_entry.assert_not_called()
 
-    def test_remove_entry_db_failure(self, api_instance):
+    def test_remove_entry_db_failure(self, logged_in_api):
         """
         Test remove_entry when database deletion fails.
         """
-        api_instance.current_user_id = 1
-        api_instance.current_master_key = b"some_master_key"
-        api_instance.db_manager.delete_entry.return_value = False
+        logged_in_api.db_manager.delete_entry.return_value = False
 
-        success, message = api_instance.remove_entry(101)
+        success, message = logged_in_api.remove_entry(101)
 
         assert success is False
         assert "Failed" in message # Check for generic failed message
-        api_instance.db_manager.delete_entry.assert_called_once_with(101, 1)
+        logged_in_api.db_manager.delete_entry.assert_called_once_with(101, 1)
 
 
 class TestMasterPasswordChange:
@@ -553,7 +554,8 @@ class TestMasterPasswordChange:
     Test suite for changing the master password in PasswordManagerAPI.
     """
 
-    def test_change_master_password_success(self, api_instance):
+    @pytest.mark.parametrize("n_entries", [2, 10, 100])
+    def test_change_master_password_success(self, api_instance, n_entries):
         """
         Test successful master password change with re-encryption of entries.
         """
@@ -581,37 +583,37 @@ class TestMasterPasswordChange:
         ]
         api_instance.encryption_handler.generate_salt.return_value = new_salt # For new salt
 
-        # Mock view_entries to return some entries
-        entry_json_1 = json.dumps({"Name": "Entry 1", "Address": "a.com", "Username": "u1", "Password": "p1", "Notes": ""})
-        entry_json_2 = json.dumps({"Name": "Entry 2", "Address": "b.com", "Username": "u2", "Password": "p2", "Notes": ""})
-        api_instance.db_manager.get_entries_by_user_id.return_value = [
-            (201, user_id, "Entry 1", b"old_encrypted_data_1"),
-            (202, user_id, "Entry 2", b"old_encrypted_data_2")
-        ]
-        api_instance.encryption_handler.decrypt_data.side_effect = [
-            entry_json_1,
-            entry_json_2
-        ]
-        api_instance.encryption_handler.encrypt_data.side_effect = [
-            b"new_encrypted_data_1",
-            b"new_encrypted_data_2"
-        ]
-        api_instance.db_manager.update_entry.return_value = True # Assume updates succeed
-        api_instance.db_manager.update_user_master_key_details.return_value = True
+        # Mock view_entries to return n entries, each with its own payload
+        rows = [(100 + i, user_id, f"Entry {i}", f"encrypted_data_{i}".encode()) for i in range(1, n_entries + 1)]
+        payloads = {
+            encrypted_data: json.dumps({"Name": entry_name, "Address": f"e{entry_id}.com",
+                                        "Username": f"u{entry_id}", "Password": f"p{entry_id}", "Notes": ""})
+            for entry_id, _, entry_name, encrypted_data in rows
+        }
+        # Look up results by input rather than popping a list, so call order does not matter
+        new_blobs = {payload: b"new_" + encrypted_data for encrypted_data, payload in payloads.items()}
+        api_instance.db_manager.get_entries_by_user_id.return_value = rows
+        api_instance.encryption_handler.decrypt_data.side_effect = lambda key, encrypted_data: payloads[encrypted_data]
+        api_instance.encryption_handler.encrypt_data.side_effect = lambda key, data: new_blobs[data]
+        api_instance.db_manager.update_master_key_and_entries.return_value = True # Assume the transaction commits
 
         success, message = api_instance.change_master_password(old_password, new_password)
 
         assert success is True
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         assert api_instance.current_master_key == new_derived_key
         api_instance.db_manager.get_user_by_username.assert_called_once_with(username)
         assert api_instance.encryption_handler.derive_key.call_count == 2
         api_instance.encryption_handler.generate_salt.assert_called_once()
         api_instance.db_manager.get_entries_by_user_id.assert_called_once_with(user_id)
-        assert api_instance.encryption_handler.decrypt_data.call_count == 2
-        assert api_instance.encryption_handler.encrypt_data.call_count == 2
-        assert api_instance.db_manager.update_entry.call_count == 2
-        api_instance.db_manager.update_user_master_key_details.assert_called_once_with(user_id, new_salt, new_derived_key)
+        assert api_instance.encryption_handler.decrypt_data.call_count == n_entries
+        assert api_instance.encryption_handler.encrypt_data.call_count == n_entries
+        # Every entry is written back with its own re-encrypted blob, together with the new key details
+        api_instance.db_manager.update_master_key_and_entries.assert_called_once_with(
+            user_id, new_salt, new_derived_key,
+            [(entry_id, b"new_" + encrypted_data) for entry_id, _, _, encrypted_data in rows])
+        api_instance.db_manager.update_entry.assert_not_called()
+        api_instance.db_manager.update_user_master_key_details.assert_not_called()
 
     def test_change_master_password_not_logged_in(self, api_instance):
         """
@@ -620,7 +622,7 @@ class TestMasterPasswordChange:
         api_instance.current_user_id = None
         success, message = api_instance.change_master_password("old", "new")
         assert success is False
-        assert message != "" # Check that a message is returned
+        assert message # Check that a message is returned
         api_instance.db_manager.get_user_by_username.assert_not_called()
 
     def test_change_master_password_incorrect_old_password(self, api_instance):
@@ -678,7 +680,7 @@ class TestMasterPasswordChange:
         api_instance.db_manager.update_user_master_key_details.assert_not_called()
         api_instance.db_manager.get_entries_by_user_id.assert_not_called()
 
-    def test_change_master_password_reencryption_failure(self, api_instance):
+    def test_change_master_password_reencryption_failure(self, api_instance, two_encrypted_entries):
         """
         Test change_master_password when re-encryption of an entry fails.
         """
@@ -703,15 +705,10 @@ class TestMasterPasswordChange:
         api_instance.encryption_handler.generate_salt.return_value = new_salt
 
         # Mock view_entries to return some entries, one of which will cause re-encryption to fail
-        entry_json_1 = json.dumps({"Name": "Entry 1", "Address": "a.com", "Username": "u1", "Password": "p1", "Notes": ""})
-        entry_json_2 = json.dumps({"Name": "Entry 2", "Address": "b.com", "Username": "u2", "Password": "p2", "Notes": ""})
-        api_instance.db_manager.get_entries_by_user_id.return_value = [
-            (201, user_id, "Entry 1", b"old_encrypted_data_1"),
-            (202, user_id, "Entry 2", b"old_encrypted_data_2")
-        ]
+        api_instance.db_manager.get_entries_by_user_id.return_value = two_encrypted_entries
         api_instance.encryption_handler.decrypt_data.side_effect = [
-            entry_json_1,
-            entry_json_2
+            _ENTRY_JSON[1],
+            _ENTRY_JSON[2]
         ]
         # Simulate encryption failure for the second entry
         api_instance.encryption_handler.encrypt_data.side_effect = [
@@ -723,11 +720,71 @@ class TestMasterPasswordChange:
 
         assert success is False
         assert "Error re-encrypting" in message # Check for generic re-encryption error
-        # Check that master key details were NOT updated in DB
+        # Check that neither the entries nor the master key details were updated in DB
+        api_instance.db_manager.update_master_key_and_entries.assert_not_called()
+        # In this API, current_master_key is only updated if db.update_master_key_and_entries succeeds
+        assert api_instance.current_master_key == old_derived_key
+
+    def test_change_master_password_save_failure(self, api_instance, two_encrypted_entries):
+        """
+        Test change_master_password when saving the re-encrypted entries and new key details fails.
+        """
+        user_id = 1
+        old_derived_key = b"old_derived_key"
+
+        api_instance.current_user_id = user_id
+        api_instance.current_master_key = old_derived_key
+        api_instance.current_username = "testuser"
+
+        api_instance.db_manager.get_user_by_username.return_value = (user_id, "testuser", b"old_salt", old_derived_key)
+        api_instance.encryption_handler.derive_key.side_effect = [old_derived_key, b"new_derived_key"]
+        api_instance.encryption_handler.decrypt_data.side_effect = [_ENTRY_JSON[1], _ENTRY_JSON[2]]
+        api_instance.db_manager.get_entries_by_user_id.return_value = two_encrypted_entries
+        api_instance.db_manager.update_master_key_and_entries.return_value = False # Simulate DB failure
+
+        success, message = api_instance.change_master_password("OldPass123!", "NewPass123!")
+
+        assert success is False
+        assert "Failed" in message
         api_instance.db_manager.update_user_master_key_details.assert_not_called()
-        # In this API, current_master_key is only updated if db.update_user_master_key_details succeeds
         assert api_instance.current_master_key == old_derived_key
 
+    def test_change_master_password_key_update_failure_commits_nothing(self, api_instance, monkeypatch):
+        """
+        Test change_master_password against a real database when the key update fails after the entry writes.
+        Neither the entries nor the master key details may be committed.
+        """
+        db_manager = DatabaseManager(db_file=':memory:')
+        user_id = db_manager.add_user("testuser", b"old_salt", b"old_derived_key")
+        entry_ids = [db_manager.add_entry(user_id, f"Entry {i}", f"encrypted_data_{i}".encode()) for i in (1, 2)]
+        # Make the users UPDATE fail; it runs only after the entry UPDATEs in the same transaction
+        db_manager.conn.execute(
+            "CREATE TRIGGER block_key_update BEFORE UPDATE ON users "
+            "BEGIN SELECT RAISE(ABORT, 'key update failed'); END"
+        )
+        monkeypatch.setattr(api_instance, "db_manager", db_manager)
+
+        api_instance.current_user_id = user_id
+        api_instance.current_master_key = b"old_derived_key"
+        api_instance.current_username = "testuser"
+        api_instance.encryption_handler.derive_key.side_effect = [b"old_derived_key", b"new_derived_key"]
+        api_instance.encryption_handler.generate_salt.return_value = b"new_salt"
+        api_instance.encryption_handler.decrypt_data.side_effect = lambda key, encrypted_data: _ENTRY_JSON[int(encrypted_data[-1:])]
+        api_instance.encryption_handler.encrypt_data.side_effect = lambda key, data: b"new_" + data.encode()
+
+        try:
+            success, message = api_instance.change_master_password("OldPass123!", "NewPass123!")
+
+            assert success is False
+            assert "No changes were made" in message
+            assert api_instance.current_master_key == b"old_derived_key"
+            assert [db_manager.get_entry_by_id(entry_id, user_id)[3] for entry_id in entry_ids] == [
+                b"encrypted_data_1", b"encrypted_data_2"
+            ]
+            assert tuple(db_manager.get_user_by_username("testuser"))[2:] == (b"old_salt", b"old_derived_key")
+        finally:
+            db_manager.close()
+
 
 class TestPasswordGeneration:
     """
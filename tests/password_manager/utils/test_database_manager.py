@@ -1,8 +1,18 @@
 import pytest
 import sqlite3
 from password_manager.utils.database_manager import DatabaseManager
+import itertools
 import os
 
+# One block of OS randomness for the whole module, handed out in slices
+_POOL = os.urandom(4096)
+_offsets = itertools.count()
+
+def _rnd(n: int) -> bytes:
+    """Returns n random bytes from the shared pool, without a syscall per call."""
+    start = next(_offsets) * 64 % (len(_POOL) - n)
+    return _POOL[start:start + n]
+
 # Define a fixture for an in-memory database manager
 @pytest.fixture
 def db_manager():
@@ -34,13 +44,61 @@ class TestDatabaseManager:
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='entries';")
         assert cursor.fetchone() is not None, "Entries table should exist"
 
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name='idx_entries_user_id';")
+        assert cursor.fetchone() is not None, "Entries user_id index should exist"
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """
+        Test that a file-backed database is switched to WAL journaling.
+        """
+        manager = DatabaseManager(db_file=str(tmp_path / "wal_test.db"))
+        try:
+            assert manager.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            manager.close()
+
+    def test_file_database_schema_created_only_when_missing(self, tmp_path, monkeypatch):
+        """
+        Test that reopening a database skips schema creation unless a table or index is missing.
+        """
+        db_file = tmp_path / "schema_test.db"
+        DatabaseManager(db_file=str(db_file)).close()
+
+        calls = []
+        original_create_tables = DatabaseManager._create_tables
+        monkeypatch.setattr(DatabaseManager, "_create_tables", lambda self: calls.append(self) or original_create_tables(self))
+
+        DatabaseManager(db_file=str(db_file)).close()
+        assert calls == []
+
+        # e.g. the file was replaced by a copy from before the index existed
+        manager = DatabaseManager(db_file=str(db_file))
+        manager.conn.execute("DROP INDEX idx_entries_user_id")
+        manager.close()
+        manager = DatabaseManager(db_file=str(db_file))
+        try:
+            assert len(calls) == 1
+            assert manager.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_entries_user_id'"
+            ).fetchone() is not None
+        finally:
+            manager.close()
+
+        db_file.unlink()
+        manager = DatabaseManager(db_file=str(db_file))
+        try:
+            assert len(calls) == 2
+            assert manager.add_user("reopened", _rnd(16), _rnd(32)) is not None
+        finally:
+            manager.close()
+
     def test_add_user_success(self, db_manager):
         """
         Test successful addition of a new user.
         """
         username = "testuser"
-        salt = os.urandom(16)
-        key_hash = os.urandom(32)
+        salt = _rnd(16)
+        key_hash = _rnd(32)
 
         user_id = db_manager.add_user(username, salt, key_hash)
         assert user_id is not None
@@ -60,8 +118,8 @@ class TestDatabaseManager:
         Test that adding a user with an existing username returns None.
         """
         username = "duplicateuser"
-        salt = os.urandom(16)
-        key_hash = os.urandom(32)
+        salt = _rnd(16)
+        key_hash = _rnd(32)
 
         db_manager.add_user(username, salt, key_hash) # First add
         duplicate_user_id = db_manager.add_user(username, salt, key_hash) # Second add
@@ -73,8 +131,8 @@ class TestDatabaseManager:
         Test retrieving an existing user by username.
         """
         username = "findme"
-        salt = os.urandom(16)
-        key_hash = os.urandom(32)
+        salt = _rnd(16)
+        key_hash = _rnd(32)
         expected_id = db_manager.add_user(username, salt, key_hash)
 
         user_data = db_manager.get_user_by_username(username)
@@ -96,12 +154,12 @@ class TestDatabaseManager:
         Test successful update of user master key details.
         """
         username = "updateuser"
-        old_salt = os.urandom(16)
-        old_hash = os.urandom(32)
+        old_salt = _rnd(16)
+        old_hash = _rnd(32)
         user_id = db_manager.add_user(username, old_salt, old_hash)
 
-        new_salt = os.urandom(16)
-        new_hash = os.urandom(32)
+        new_salt = _rnd(16)
+        new_hash = _rnd(32)
 
         updated = db_manager.update_user_master_key_details(user_id, new_salt, new_hash)
         assert updated is True
@@ -115,8 +173,8 @@ class TestDatabaseManager:
         """
         Test updating master key details for a non-existent user returns False.
         """
-        new_salt = os.urandom(16)
-        new_hash = os.urandom(32)
+        new_salt = _rnd(16)
+        new_hash = _rnd(32)
         updated = db_manager.update_user_master_key_details(999, new_salt, new_hash) # Non-existent ID
         assert updated is False
 
@@ -124,7 +182,7 @@ class TestDatabaseManager:
         """
         Test successful addition of a new entry for a user.
         """
-        user_id = db_manager.add_user("entryuser", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("entryuser", _rnd(16), _rnd(32))
         entry_name = "Website Login"
         encrypted_data = b"encrypted_login_data"
 
@@ -145,8 +203,8 @@ class TestDatabaseManager:
         """
         Test retrieving all entries for a specific user.
         """
-        user1_id = db_manager.add_user("user1", os.urandom(16), os.urandom(32))
-        user2_id = db_manager.add_user("user2", os.urandom(16), os.urandom(32))
+        user1_id = db_manager.add_user("user1", _rnd(16), _rnd(32))
+        user2_id = db_manager.add_user("user2", _rnd(16), _rnd(32))
 
         db_manager.add_entry(user1_id, "Entry A", b"data_a")
         db_manager.add_entry(user1_id, "Entry B", b"data_b")
@@ -168,7 +226,7 @@ class TestDatabaseManager:
         """
         Test retrieving a single entry by ID for a specific user.
         """
-        user_id = db_manager.add_user("singleentryuser", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("singleentryuser", _rnd(16), _rnd(32))
         entry_name = "Specific Entry"
         encrypted_data = b"specific_data"
         expected_entry_id = db_manager.add_entry(user_id, entry_name, encrypted_data)
@@ -179,12 +237,13 @@ class TestDatabaseManager:
         assert entry[1] == user_id
         assert entry[2] == entry_name
         assert entry[3] == encrypted_data
+        assert entry["entry_name"] == entry_name  # Columns can also be read by name
 
     def test_get_entry_by_id_not_found(self, db_manager):
         """
         Test retrieving a non-existent entry by ID returns None.
         """
-        user_id = db_manager.add_user("anotheruser", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("anotheruser", _rnd(16), _rnd(32))
         entry = db_manager.get_entry_by_id(999, user_id) # Non-existent entry ID
         assert entry is None
 
@@ -192,8 +251,8 @@ class TestDatabaseManager:
         """
         Test retrieving an entry with correct ID but wrong user ID returns None.
         """
-        user1_id = db_manager.add_user("user_a", os.urandom(16), os.urandom(32))
-        user2_id = db_manager.add_user("user_b", os.urandom(16), os.urandom(32))
+        user1_id = db_manager.add_user("user_a", _rnd(16), _rnd(32))
+        user2_id = db_manager.add_user("user_b", _rnd(16), _rnd(32))
         entry_id = db_manager.add_entry(user1_id, "User A's Entry", b"user_a_data")
 
         entry = db_manager.get_entry_by_id(entry_id, user2_id) # Try to get user1's entry with user2's ID
@@ -203,7 +262,7 @@ class TestDatabaseManager:
         """
         Test successful update of an existing entry.
         """
-        user_id = db_manager.add_user("update_test_user", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("update_test_user", _rnd(16), _rnd(32))
         entry_id = db_manager.add_entry(user_id, "Old Name", b"old_data")
 
         new_name = "New Name"
@@ -220,7 +279,7 @@ class TestDatabaseManager:
         """
         Test updating a non-existent entry returns False.
         """
-        user_id = db_manager.add_user("update_fail_user", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("update_fail_user", _rnd(16), _rnd(32))
         updated = db_manager.update_entry(999, user_id, "Fake Name", b"fake_data") # Non-existent entry ID
         assert updated is False
 
@@ -228,8 +287,8 @@ class TestDatabaseManager:
         """
         Test updating an entry with correct ID but wrong user ID returns False.
         """
-        user1_id = db_manager.add_user("update_user1", os.urandom(16), os.urandom(32))
-        user2_id = db_manager.add_user("update_user2", os.urandom(16), os.urandom(32))
+        user1_id = db_manager.add_user("update_user1", _rnd(16), _rnd(32))
+        user2_id = db_manager.add_user("update_user2", _rnd(16), _rnd(32))
         entry_id = db_manager.add_entry(user1_id, "User1's Entry", b"user1_data")
 
         updated = db_manager.update_entry(entry_id, user2_id, "Attempted Update", b"new_data")
@@ -240,11 +299,76 @@ class TestDatabaseManager:
         assert entry[2] == "User1's Entry"
         assert entry[3] == b"user1_data"
 
+    def test_update_master_key_and_entries_success(self, db_manager):
+        """
+        Test that update_master_key_and_entries replaces the data of every given entry and the key details.
+        """
+        user_id = db_manager.add_user("bulk_user", _rnd(16), _rnd(32))
+        entry1_id = db_manager.add_entry(user_id, "Entry 1", b"old_data_1")
+        entry2_id = db_manager.add_entry(user_id, "Entry 2", b"old_data_2")
+        new_salt, new_hash = _rnd(16), _rnd(32)
+
+        updated = db_manager.update_master_key_and_entries(
+            user_id, new_salt, new_hash, [(entry1_id, b"new_data_1"), (entry2_id, b"new_data_2")]
+        )
+        assert updated is True
+
+        assert db_manager.get_entry_by_id(entry1_id, user_id)[3] == b"new_data_1"
+        assert db_manager.get_entry_by_id(entry2_id, user_id)[3] == b"new_data_2"
+        assert db_manager.get_entry_by_id(entry1_id, user_id)[2] == "Entry 1" # Names are left as they were
+        user_data = db_manager.get_user_by_username("bulk_user")
+        assert user_data[2] == new_salt
+        assert user_data[3] == new_hash
+
+    def test_update_master_key_and_entries_without_entries(self, db_manager):
+        """
+        Test that the key details are still updated when the user has no entries.
+        """
+        user_id = db_manager.add_user("no_entries_user", _rnd(16), _rnd(32))
+        new_salt, new_hash = _rnd(16), _rnd(32)
+
+        assert db_manager.update_master_key_and_entries(user_id, new_salt, new_hash, []) is True
+        assert db_manager.get_user_by_username("no_entries_user")[2] == new_salt
+
+    def test_update_master_key_and_entries_rolls_back_on_missing_entry(self, db_manager):
+        """
+        Test that no change is kept if any entry does not belong to the user.
+        """
+        old_salt = _rnd(16)
+        user_id = db_manager.add_user("bulk_fail_user", old_salt, _rnd(32))
+        entry_id = db_manager.add_entry(user_id, "Entry", b"old_data")
+
+        updated = db_manager.update_master_key_and_entries(
+            user_id, _rnd(16), _rnd(32), [(entry_id, b"new_data"), (999, b"fake_data")]
+        )
+        assert updated is False
+
+        assert db_manager.get_entry_by_id(entry_id, user_id)[3] == b"old_data"
+        assert db_manager.get_user_by_username("bulk_fail_user")[2] == old_salt
+
+    def test_update_master_key_and_entries_rolls_back_on_key_update_error(self, db_manager):
+        """
+        Test that the entry writes are rolled back if the key update fails after them.
+        """
+        old_salt = _rnd(16)
+        user_id = db_manager.add_user("key_fail_user", old_salt, _rnd(32))
+        entry_id = db_manager.add_entry(user_id, "Entry", b"old_data")
+        db_manager.conn.execute(
+            "CREATE TRIGGER block_key_update BEFORE UPDATE ON users "
+            "BEGIN SELECT RAISE(ABORT, 'key update failed'); END"
+        )
+
+        updated = db_manager.update_master_key_and_entries(user_id, _rnd(16), _rnd(32), [(entry_id, b"new_data")])
+        assert updated is False
+
+        assert db_manager.get_entry_by_id(entry_id, user_id)[3] == b"old_data"
+        assert db_manager.get_user_by_username("key_fail_user")[2] == old_salt
+
     def test_delete_entry_success(self, db_manager):
         """
         Test successful deletion of an entry.
         """
-        user_id = db_manager.add_user("delete_test_user", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("delete_test_user", _rnd(16), _rnd(32))
         entry_id = db_manager.add_entry(user_id, "Entry to Delete", b"data_to_delete")
 
         deleted = db_manager.delete_entry(entry_id, user_id)
@@ -260,7 +384,7 @@ class TestDatabaseManager:
         """
         Test deleting a non-existent entry returns False.
         """
-        user_id = db_manager.add_user("delete_fail_user", os.urandom(16), os.urandom(32))
+        user_id = db_manager.add_user("delete_fail_user", _rnd(16), _rnd(32))
         deleted = db_manager.delete_entry(999, user_id) # Non-existent entry ID
         assert deleted is False
 
@@ -268,8 +392,8 @@ class TestDatabaseManager:
         """
         Test deleting an entry with correct ID but wrong user ID returns False.
         """
-        user1_id = db_manager.add_user("delete_user1", os.urandom(16), os.urandom(32))
-        user2_id = db_manager.add_user("delete_user2", os.urandom(16), os.urandom(32))
+        user1_id = db_manager.add_user("delete_user1", _rnd(16), _rnd(32))
+        user2_id = db_manager.add_user("delete_user2", _rnd(16), _rnd(32))
         entry_id = db_manager.add_entry(user1_id, "User1's Entry", b"user1_data")
 
         deleted = db_manager.delete_entry(entry_id, user2_id)
@@ -288,7 +412,7 @@ class TestDatabaseManager:
         assert db_manager.cursor is None
         # Attempting an operation after closing should raise an error
         with pytest.raises((sqlite3.ProgrammingError, AttributeError)):
-            db_manager.add_user("closed_user", os.urandom(16), os.urandom(32))
+            db_manager.add_user("closed_user", _rnd(16), _rnd(32))
 
     def test_del_closes_connection(self):
         """
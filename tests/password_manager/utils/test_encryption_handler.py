@@ -1,7 +1,24 @@
 import pytest
+from base64 import urlsafe_b64encode
+from cryptography.fernet import Fernet
 from password_manager.utils.encryption_handler import EncryptionHandler
 import os
 
+# Key derivation here is real Argon2id, which dominates the suite's runtime
+pytestmark = pytest.mark.slow
+
+@pytest.fixture(scope="session")
+def shared_key():
+    """Derives one (salt, key) pair for all encrypt/decrypt tests, as key derivation dominates their runtime."""
+    salt = EncryptionHandler.generate_salt()
+    return salt, EncryptionHandler.derive_key("secure_password", salt)
+
+@pytest.fixture(scope="session")
+def wrong_key(shared_key):
+    """A key derived from a different password with the shared salt."""
+    salt, _ = shared_key
+    return EncryptionHandler.derive_key("wrong_password", salt)
+
 class TestEncryptionHandler:
     """
     Test suite for the EncryptionHandler class.
@@ -41,13 +58,11 @@ class TestEncryptionHandler:
         assert key1 != key3
         assert key1 != key4
 
-    def test_encrypt_decrypt_data_success(self):
+    def test_encrypt_decrypt_data_success(self, shared_key):
         """
         Test successful encryption and decryption of data.
         """
-        password = "secure_password"
-        salt = EncryptionHandler.generate_salt()
-        key = EncryptionHandler.derive_key(password, salt)
+        _, key = shared_key
         original_data = "This is a secret message."
 
         encrypted_data = EncryptionHandler.encrypt_data(key, original_data)
@@ -57,29 +72,22 @@ class TestEncryptionHandler:
         assert encrypted_data != original_data.encode('utf-8') # Ensure it's actually encrypted
         assert decrypted_data == original_data
 
-    def test_decrypt_data_with_wrong_key(self):
+    def test_decrypt_data_with_wrong_key(self, shared_key, wrong_key):
         """
         Test that decrypt_data returns None when an incorrect key is used.
         """
-        password = "correct_password"
-        salt = EncryptionHandler.generate_salt()
-        key = EncryptionHandler.derive_key(password, salt)
+        _, key = shared_key
         original_data = "Some sensitive data."
         encrypted_data = EncryptionHandler.encrypt_data(key, original_data)
 
-        wrong_password = "wrong_password"
-        wrong_key = EncryptionHandler.derive_key(wrong_password, salt)
-
         decrypted_data = EncryptionHandler.decrypt_data(wrong_key, encrypted_data)
         assert decrypted_data is None
 
-    def test_decrypt_data_with_tampered_data(self):
+    def test_decrypt_data_with_tampered_data(self, shared_key):
         """
         Test that decrypt_data returns None when the encrypted data is tampered with.
         """
-        password = "another_password"
-        salt = EncryptionHandler.generate_salt()
-        key = EncryptionHandler.derive_key(password, salt)
+        _, key = shared_key
         original_data = "Data to be tampered."
         encrypted_data = EncryptionHandler.encrypt_data(key, original_data)
 
@@ -89,13 +97,11 @@ class TestEncryptionHandler:
         decrypted_data = EncryptionHandler.decrypt_data(key, tampered_data)
         assert decrypted_data is None
 
-    def test_encrypt_decrypt_empty_string(self):
+    def test_encrypt_decrypt_empty_string(self, shared_key):
         """
         Test encryption and decryption of an empty string.
         """
-        password = "empty_test_password"
-        salt = EncryptionHandler.generate_salt()
-        key = EncryptionHandler.derive_key(password, salt)
+        _, key = shared_key
         original_data = ""
 
         encrypted_data = EncryptionHandler.encrypt_data(key, original_data)
@@ -103,13 +109,11 @@ class TestEncryptionHandler:
 
         assert decrypted_data == original_data
 
-    def test_encrypt_decrypt_long_string(self):
+    def test_encrypt_decrypt_long_string(self, shared_key):
         """
         Test encryption and decryption of a long string.
         """
-        password = "long_string_password"
-        salt = EncryptionHandler.generate_salt()
-        key = EncryptionHandler.derive_key(password, salt)
+        _, key = shared_key
         original_data = "a" * 1000 # A long string
 
         encrypted_data = EncryptionHandler.encrypt_data(key, original_data)
@@ -120,14 +124,14 @@ class TestEncryptionHandler:
     def test_encrypt_data_raises_exception_on_invalid_key_length(self):
         """
         Test that encrypt_data raises an exception if the key length is not 32 bytes.
-        Note: Fernet expects a 32-byte key. While derive_key ensures this,
+        Note: AES-256-GCM expects a 32-byte key. While derive_key ensures this,
         we test direct passing of an invalid key to encrypt_data.
         """
         # Create an intentionally wrong-sized key
         invalid_key = os.urandom(16) # 16 bytes instead of 32
         data = "some data"
 
-        with pytest.raises(ValueError): # Fernet expects a 32-byte key
+        with pytest.raises(ValueError): # AES-256 expects a 32-byte key
             EncryptionHandler.encrypt_data(invalid_key, data)
 
     def test_decrypt_data_fails_on_invalid_key_length(self):
@@ -137,6 +141,26 @@ class TestEncryptionHandler:
         invalid_key = os.urandom(16)
         encrypted_data = b"some_encrypted_bytes" # Dummy encrypted data
 
-        # Fernet expects a 32-byte key
+        # AES-256-GCM expects a 32-byte key
         assert EncryptionHandler.decrypt_data(invalid_key, encrypted_data) is None
-    
\ No newline at end of file
+    
+    def test_encrypt_data_uses_versioned_aesgcm_format(self, shared_key):
+        """
+        Test that encrypt_data output starts with the AES-GCM version byte and a fresh nonce.
+        """
+        _, key = shared_key
+
+        encrypted_1 = EncryptionHandler.encrypt_data(key, "same data")
+        encrypted_2 = EncryptionHandler.encrypt_data(key, "same data")
+
+        assert encrypted_1[:1] == EncryptionHandler.AESGCM_VERSION
+        assert encrypted_1 != encrypted_2  # Nonces must not repeat
+
+    def test_decrypt_data_reads_legacy_fernet_tokens(self, shared_key):
+        """
+        Test that data encrypted with Fernet by earlier versions still decrypts.
+        """
+        _, key = shared_key
+        legacy_token = Fernet(urlsafe_b64encode(key)).encrypt("legacy data".encode('utf-8'))
+
+        assert EncryptionHandler.decrypt_data(key, legacy_token) == "legacy data"
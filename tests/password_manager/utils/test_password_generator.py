@@ -1,6 +1,12 @@
 import pytest
 from password_manager.utils.password_generator import PasswordGenerator
 
+# Character sets as frozensets for constant-time membership checks
+_LOWER = frozenset(PasswordGenerator.LOWERCASE_CHARS)
+_UPPER = frozenset(PasswordGenerator.UPPERCASE_CHARS)
+_DIGITS = frozenset(PasswordGenerator.DIGIT_CHARS)
+_SPECIAL = frozenset(PasswordGenerator.SPECIAL_CHARS)
+
 class TestPasswordGenerator:
     """
     Test suite for the PasswordGenerator class.
@@ -16,10 +22,10 @@ class TestPasswordGenerator:
 
         assert password is not None
         assert len(password) == length
-        assert any(c in PasswordGenerator.LOWERCASE_CHARS for c in password)
-        assert any(c in PasswordGenerator.UPPERCASE_CHARS for c in password)
-        assert any(c in PasswordGenerator.DIGIT_CHARS for c in password)
-        assert any(c in PasswordGenerator.SPECIAL_CHARS for c in password)
+        assert not _LOWER.isdisjoint(password)
+        assert not _UPPER.isdisjoint(password)
+        assert not _DIGITS.isdisjoint(password)
+        assert not _SPECIAL.isdisjoint(password)
 
     def test_generate_password_custom_length(self):
         """
@@ -37,11 +43,11 @@ class TestPasswordGenerator:
         length = 20
         password = PasswordGenerator.generate_password(length, use_uppercase=False)
         assert password is not None
-        assert not any(c in PasswordGenerator.UPPERCASE_CHARS for c in password)
+        assert _UPPER.isdisjoint(password)
         # It should still contain the other character types
-        assert any(c in PasswordGenerator.LOWERCASE_CHARS for c in password)
-        assert any(c in PasswordGenerator.DIGIT_CHARS for c in password)
-        assert any(c in PasswordGenerator.SPECIAL_CHARS for c in password)
+        assert not _LOWER.isdisjoint(password)
+        assert not _DIGITS.isdisjoint(password)
+        assert not _SPECIAL.isdisjoint(password)
 
     def test_generate_password_only_digits(self):
         """
@@ -55,7 +61,7 @@ class TestPasswordGenerator:
             use_special_chars=False
         )
         assert password is not None
-        assert all(c in PasswordGenerator.DIGIT_CHARS for c in password)
+        assert set(password) <= _DIGITS
 
     def test_generate_password_only_lowercase(self):
         """
@@ -69,7 +75,7 @@ class TestPasswordGenerator:
             use_special_chars=False
         )
         assert password is not None
-        assert all(c in PasswordGenerator.LOWERCASE_CHARS for c in password)
+        assert set(password) <= _LOWER
 
     def test_generate_password_all_options_false_returns_none(self):
         """
@@ -109,10 +115,41 @@ class TestPasswordGenerator:
         assert password is not None
         assert len(password) == length
 
-    @pytest.mark.parametrize("length", [8, 11, 16, 23, 32])
-    def test_generate_password_is_not_none_for_valid_lengths(self, length):
+    def test_generate_password_valid_lengths(self):
         """
-        Uses pytest's parametrize to test multiple valid lengths.
+        Tests several valid lengths in one pass.
         """
-        password = PasswordGenerator.generate_password(length)
+        for length in (8, 11, 16, 23, 32):
+            password = PasswordGenerator.generate_password(length)
+            assert password is not None, length
+            assert len(password) == length
+
+    def test_character_pools_remove_excluded_chars(self):
+        """
+        Tests that excluded characters are removed from every selected pool
+        and that deselected categories are left out.
+        """
+        pools = PasswordGenerator.character_pools(
+            use_uppercase=True, use_lowercase=True, use_digits=True,
+            use_special_chars=False, excluded_chars="l1IO0"
+        )
+        assert len(pools) == 3
+        assert all(set(pool).isdisjoint("l1IO0") for pool in pools)
+
+    def test_generate_from_pools_keeps_length_and_categories(self):
+        """
+        Tests that a password drawn from reduced pools still has the requested
+        length and at least one character from each pool.
+        """
+        pools = PasswordGenerator.character_pools(excluded_chars="l1IO0{}[]()/\\|`~")
+        password = PasswordGenerator.generate_from_pools(40, pools)
         assert password is not None
+        assert len(password) == 40
+        assert all(not set(pool).isdisjoint(password) for pool in pools)
+        assert set(password).isdisjoint("l1IO0{}[]()/\\|`~")
+
+    def test_generate_from_pools_no_pools(self):
+        """
+        Tests that generating from an empty set of pools returns None.
+        """
+        assert PasswordGenerator.generate_from_pools(16, ()) is None
@@ -0,0 +1,87 @@
+import pytest
+import time
+from PyQt6.QtCore import Qt
+from password_manager.views.entries_table_model import EntriesTableModel
+
+def _entries(ids):
+    """Builds entry dictionaries with the given ids."""
+    return [{"id": i, "Name": f"Entry {i:05d}", "Address": ""} for i in ids]
+
+@pytest.fixture
+def model_signals():
+    """
+    Provides an EntriesTableModel and a list recording the structural signals it emits.
+    """
+    model = EntriesTableModel()
+    signals = []
+    model.modelReset.connect(lambda: signals.append(("reset",)))
+    model.rowsRemoved.connect(lambda parent, first, last: signals.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda parent, first, last: signals.append(("inserted", first, last)))
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: signals.append(("changed", top_left.row(), bottom_right.row())))
+    return model, signals
+
+def _displayed_ids(model):
+    """Returns the entry ids in display order."""
+    return [model.data(model.index(row, 0), Qt.ItemDataRole.UserRole) for row in range(model.rowCount())]
+
+class TestEntriesTableModel:
+    """
+    Test suite for the EntriesTableModel class.
+    """
+
+    def test_set_entries_removes_and_inserts_only_changed_runs(self, model_signals):
+        """
+        Test that a small change emits one remove and one insert per contiguous run of rows.
+        """
+        model, signals = model_signals
+        model.set_entries(_entries(range(10)))
+        signals.clear()
+
+        model.set_entries(_entries([0, 1, 5, 6, 7, 20, 21, 8, 9]))
+
+        assert signals == [("removed", 2, 4), ("inserted", 5, 6)]
+        assert _displayed_ids(model) == [0, 1, 5, 6, 7, 20, 21, 8, 9]
+
+    def test_set_entries_updates_changed_contents_in_place(self, model_signals):
+        """
+        Test that entries with unchanged ids but new contents emit dataChanged instead of row signals.
+        """
+        model, signals = model_signals
+        model.set_entries(_entries(range(3)))
+        signals.clear()
+
+        entries = _entries(range(3))
+        entries[1]["Name"] = "Renamed"
+        model.set_entries(entries)
+
+        assert signals == [("changed", 1, 1)]
+        assert model.data(model.index(1, 0)) == "Renamed"
+
+    def test_set_entries_resets_on_reorder(self, model_signals):
+        """
+        Test that kept rows changing their relative order fall back to a model reset.
+        """
+        model, signals = model_signals
+        model.set_entries(_entries([1, 2, 3]))
+        signals.clear()
+
+        model.set_entries(_entries([3, 1, 2, 4]))
+
+        assert signals == [("reset",)]
+        assert _displayed_ids(model) == [3, 1, 2, 4]
+
+    def test_set_entries_large_alternating_filter_resets_once(self, model_signals):
+        """
+        Test that filtering out every other row of a large list emits a single reset and stays fast.
+        """
+        model, signals = model_signals
+        model.set_entries(_entries(range(10_000)))
+        signals.clear()
+
+        start = time.perf_counter()
+        model.set_entries(_entries(range(0, 10_000, 2)))
+        elapsed = time.perf_counter() - start
+
+        assert signals == [("reset",)]
+        assert _displayed_ids(model) == list(range(0, 10_000, 2))
+        assert elapsed < 0.5 # The diff is linear; the previous SequenceMatcher took seconds here